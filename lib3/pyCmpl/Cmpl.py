@@ -45,6 +45,7 @@ import pickle
 import traceback
 import shutil
 import collections
+import concurrent.futures
 import re 
 
 
@@ -59,6 +60,7 @@ from .CmplInstance import *
 from .CmplXlsData import *
 from .CmplArgs import *
 from .CmplSolutionReport import *
+from .CmplDataWriter import *
 
 
 #################################################################################
@@ -94,12 +96,15 @@ class Cmpl(threading.Thread):
 
         self.__baseName = os.path.splitext(self.__cmplFile)[0]
 
-        self.__cmplDataStr = io.StringIO()
-
         self.__setList = []
         self.__parameterList = []
         self.__optionsList = {}
 
+        self.__dataCacheLimit = CMPL_DATA_CACHE_LIMIT
+        self.__dataCache = CmplDataCache()
+        self.__dataWorkers = 1
+        self.__solutionWorkers = 1
+
         self.__xlsData = None
         self.__isXlsData = False
         self.__xlsDataFile = ""
@@ -107,6 +112,12 @@ class Cmpl(threading.Thread):
         self.__status = None
         self.__solutions = None
         self.__solutionString = ""
+        self.__columnarSolution = False
+        self.__solutionFilter = (None, None, False)
+        self.__varNamesSolNr = None
+        self.__conNamesSolNr = None
+        self.__varNames = {}
+        self.__conNames = {}
 
         self.__remoteMode = False
         self.__remoteStatus = CMPL_UNKNOWN
@@ -177,7 +188,6 @@ class Cmpl(threading.Thread):
             try:
                 self.__cleanUp()
                 #self.__outputString.close()
-                self.__cmplDataStr.close()
             except:
                 pass
     # *********** end destructor *********
@@ -535,12 +545,28 @@ class Cmpl(threading.Thread):
 
     # *********** end setRefreshTime *****
 
+    # *********** setColumnarSolution ****
+    # the variables and constraints of the solutions are held in columns (CmplSolElements)
+    def setColumnarSolution(self, ok=True):
+        self.__columnarSolution = ok
+
+    # *********** end setColumnarSolution 
+
+    # *********** setSolutionFilter ******
+    # only the variables and constraints whose names match one of the patterns (fnmatch syntax,
+    # e.g. "x*") and optionally only those with a nonzero activity are read from the solution
+    # - None means all elements, an empty list no element
+    def setSolutionFilter(self, vars=None, cons=None, nonZerosOnly=False):
+        self.__solutionFilter = (vars, cons, nonZerosOnly)
+
+    # *********** end setSolutionFilter **
+
     # *********** setSet *****************
     def setSet(self, set):
         if type(set) != CmplSet:
             raise CmplException(str(set) + " is not a CMPL set ")
         else:
-            if len(set.valueList) != 0:
+            if set.len != 0:
                 self.__setList.append(set)
                 exec('self.'+set.name+'=set')
             else:
@@ -564,7 +590,7 @@ class Cmpl(threading.Thread):
         if type(param) != CmplParameter:
             raise CmplException("Cmpl.setParameter: " + str(param) + " is not a CMPL parameter ")
         else:
-            if len(param.values) != 0:
+            if param.isStream or len(param.values) != 0:
                 self.__parameterList.append(param)
                 exec('self.'+param.name+'=param')
             else:
@@ -583,6 +609,33 @@ class Cmpl(threading.Thread):
 
     # *********** end setSets *************
 
+    # *********** setDataCacheLimit *******
+    # formatted sets and parameters up to limit characters are reused in the next solve
+    # as long as they are not changed by setValues - in-place changes of the values
+    # have to be passed by setValues again
+    def setDataCacheLimit(self, limit):
+        if type(limit) != int or limit < 0:
+            raise CmplException("Cmpl.setDataCacheLimit: " + str(limit) + " is not a valid cache limit")
+        self.__dataCacheLimit = limit
+        if limit == 0:
+            self.__dataCache.clear()
+    # *********** end setDataCacheLimit ***
+
+    # *********** setDataWorkers **********
+    def setDataWorkers(self, workers):
+        if type(workers) != int:
+            raise CmplException("Cmpl.setDataWorkers: " + str(workers) + " is not a valid number of worker processes")
+        self.__dataWorkers = workers
+    # *********** end setDataWorkers ******
+
+    # *********** setSolutionWorkers ******
+    # number of worker processes that parse the elements of solution files above 1 GB
+    def setSolutionWorkers(self, workers):
+        if type(workers) != int:
+            raise CmplException("Cmpl.setSolutionWorkers: " + str(workers) + " is not a valid number of worker processes")
+        self.__solutionWorkers = workers
+    # *********** end setSolutionWorkers **
+
     # *********** setOption ***************
     def setOption(self, option):
         if type(option) != str:
@@ -654,7 +707,7 @@ class Cmpl(threading.Thread):
         if solNr < 0 or solNr > self.__solutions.nrOfSolutions - 1:
             raise CmplException("Solution with index " + str(solNr) + " doesn't exist.")
         s = self.__solByNr(solNr)
-        return self.__getElementByName(name, s.variables)
+        return self.__getElementByName(name, s.varNameIndex)
     # *********** end getVarByName ********
 
     # *********** getConByName ************
@@ -662,7 +715,7 @@ class Cmpl(threading.Thread):
         if solNr < 0 or solNr > self.__solutions.nrOfSolutions - 1:
             raise CmplException("Solution with index " + str(solNr) + " doesn't exist.")
         s = self.__solByNr(solNr)
-        return self.__getElementByName(name, s.constraints)
+        return self.__getElementByName(name, s.conNameIndex)
     # *********** end getConByName ********
 
     ##### Lassen als public wenn andere Lösungen als die erste gefragt sind
@@ -671,8 +724,8 @@ class Cmpl(threading.Thread):
         if self.__solutions.nrOfSolutions >0:
             if solNr < 0 or solNr > self.__solutions.nrOfSolutions - 1:
                 raise CmplException("Solution with index " + str(solNr) + " doesn't exist.")
-            s = self.__solByNr(solNr)
-            self.__elementByName(s.variables)
+            self.__varNamesSolNr = solNr
+            self.__varNames = {}
     # *********** end varByName ***********
 
     # *********** conByName ***************
@@ -680,8 +733,8 @@ class Cmpl(threading.Thread):
         if self.__solutions.nrOfSolutions >0:
             if solNr < 0 or solNr > self.__solutions.nrOfSolutions - 1:
                 raise CmplException("Solution with index " + str(solNr) + " doesn't exist.")
-            s = self.__solByNr(solNr)
-            self.__elementByName(s.constraints)
+            self.__conNamesSolNr = solNr
+            self.__conNames = {}
     # *********** end conByName ***********
 
     # *********** solve *******************
@@ -693,7 +746,7 @@ class Cmpl(threading.Thread):
                 raise CmplException("Model is not connected to a CmplServer")
 
             self.__status = CmplMessages()
-            self.__solutions = CmplSolutions()
+            self.__solutions = self.__newSolutions()
 
             tries = 0
             while True: # loop is intended for CMPLGrid
@@ -782,7 +835,7 @@ class Cmpl(threading.Thread):
             self.__cmplDataElements()
 
             self.__status = CmplMessages(self.__cmplMsgFile)
-            self.__solutions = CmplSolutions(self.__cmplSolFile)                      
+            self.__solutions = self.__newSolutions(self.__cmplSolFile)                      
                       
             if self.__cmplArgs.runMode==PYCMPL:
                 cmdList = [self.__cmplBinName, self.__cmplFileAlias, "-solution"]
@@ -914,13 +967,17 @@ class Cmpl(threading.Thread):
             if self.__remoteStatus == PROBLEM_RUNNING:
                 raise CmplException("Don't send the problem again before the CmplServer finished the previous one")
 
-            self.__cmplDataElements()
-
-            self.__status = CmplMessages()
-            self.__solutions = CmplSolutions()
-            self.__cmplInstance = CmplInstance()
-            self.__instStr = self.__cmplInstance.cmplInstanceStr(self.__cmplFile, self.__cmplArgs, list(self.__optionsList.values()),
-                                                                 self.__cmplDataStr.getvalue(), self.__jobId)
+            with tempfile.TemporaryFile(mode='w+') as dataFile:
+                dataStream = ""
+                if self.__cmplDataElements(dataFile) > 0:
+                    dataFile.seek(0)
+                    dataStream = dataFile
+
+                self.__status = CmplMessages()
+                self.__solutions = self.__newSolutions()
+                self.__cmplInstance = CmplInstance()
+                self.__instStr = self.__cmplInstance.cmplInstanceStr(self.__cmplFile, self.__cmplArgs, list(self.__optionsList.values()),
+                                                                     dataStream, self.__jobId)
      
             ret = self.__cmplServerExecute("send")
 
@@ -993,8 +1050,9 @@ class Cmpl(threading.Thread):
                     self.__cleanUp()
                     raise CmplException(ret[1])
                 else:
-                    self.__solutionString = ret[2]
-                    self.__solutions.readSolution(self.__solutionString)
+                    # the solution is kept by CmplSolutions in a temporary file
+                    self.__solutions.readSolution(ret[2])
+                    self.__solutionString = ""
 
                 self.__solReport=CmplSolutionReport(self.__solutions)
              
@@ -1056,6 +1114,35 @@ class Cmpl(threading.Thread):
             self.__handleOutput("CMPL: Solution has been written to cmplSolution file: " + solFile)
     # *********** end saveSolution ********
 
+    # *********** saveSolutionBinary ******
+    # binary snapshot of the solutions that can be read by readSolutionBinary much faster than a cmplSolution file
+    def saveSolutionBinary(self, solFileName=None):
+        if self.__solutions is not None and self.__solutions.nrOfSolutions > 0:
+            if solFileName == None:
+                solFile = self.__baseName + ".csolb"
+            else:
+                solFile = solFileName
+            self.__solutions.saveBinary(solFile)
+            self.__handleOutput("CMPL: Solution has been written to binary solution file: " + solFile)
+        else:
+            raise CmplException("No Solution found so far")
+    # *********** end saveSolutionBinary **
+
+    # *********** readSolutionBinary ******
+    def readSolutionBinary(self, solFileName=None):
+        if solFileName == None:
+            solFile = self.__baseName + ".csolb"
+        else:
+            solFile = solFileName
+        if not os.path.isfile(solFile):
+            raise CmplException("Binary solution file " + solFile + " does not exist.")
+        self.__solutions = self.__newSolutions()
+        self.__solutions.readBinary(solFile)
+        self.__solReport = CmplSolutionReport(self.__solutions)
+        self.conByName()
+        self.varByName()
+    # *********** end readSolutionBinary **
+
     # *********** saveSolutionAscii *******
     def saveSolutionAscii(self, solFileName=None):
         if self.__solutions.nrOfSolutions > 0:
@@ -1071,13 +1158,15 @@ class Cmpl(threading.Thread):
     # *********** saveSolutionAscii *******
 
     # *********** saveSolutionCsv *******
-    def saveSolutionCsv(self, solFileName=None):
+    # compress: the file is written as gzip stream
+    # nonZerosOnly: only variables and constraints with a nonzero activity are exported
+    def saveSolutionCsv(self, solFileName=None, compress=False, nonZerosOnly=False):
         if self.__solutions.nrOfSolutions > 0:
             if solFileName == None:
                 solFile = self.__baseName + ".sol"
             else:
                 solFile = solFileName
-            self.__solReport.saveSolutionCsv( os.path.basename(self.__cmplFile), solFile )
+            self.__solReport.saveSolutionCsv( os.path.basename(self.__cmplFile), solFile, compress, nonZerosOnly )
             self.__handleOutput("CMPL: Solution has been written to CSV file: " + solFile)
         else:
             raise CmplException("No Solution found so far")
@@ -1085,9 +1174,40 @@ class Cmpl(threading.Thread):
     # *********** saveSolutionCsv *******
 
     # *********** solutionReport **********
-    def solutionReport(self, fileName=None):
-        self.__solReport.solutionReport(os.path.basename(self.__cmplFile), fileName)
+    # the report can be restricted to variables and constraints with a nonzero activity (nonZerosOnly), whose names
+    # match name patterns (names), to the topK elements by absolute activity or marginal (topKBy) and to limit elements
+    def solutionReport(self, fileName=None, nonZerosOnly=False, names=None, topK=None, topKBy="activity", limit=None):
+        self.__solReport.solutionReport(os.path.basename(self.__cmplFile), fileName, nonZerosOnly, names, topK, topKBy, limit)
     # *********** end solutionReport ******
+
+    # *********** solutionDiff ************
+    # differences between the solution solNr and the solution otherSolNr of another model (Cmpl) or of
+    # CmplSolutions, or a CmplSolution
+    # returns the differences of the variables and of the constraints (CmplSolDiff)
+    def solutionDiff(self, other, tol=1e-9, solNr=0, otherSolNr=0):
+        if self.__solutions is None or self.__solutions.nrOfSolutions == 0:
+            raise CmplException("No Solution found so far")
+        if isinstance(other, Cmpl):
+            if other.__solutions is None or other.__solutions.nrOfSolutions == 0:
+                raise CmplException("No Solution found so far for the model " + os.path.basename(other.__cmplFile))
+            if otherSolNr < 0 or otherSolNr >= len(other.solutionPool):
+                raise CmplException("Solution with index " + str(otherSolNr) + " doesn't exist.")
+            other = other.solutionPool[otherSolNr]
+        return self.__solutions.diff(other, tol, solNr, otherSolNr)
+    # *********** end solutionDiff ********
+
+    # *********** solutionMatrix **********
+    # activities (or lowerBound, upperBound, marginal) of the variables or the constraints of the solutions of
+    # several models (Cmpl) or of CmplSolution objects with one row per element and one column per solution
+    # - by default the solution pool of this model
+    # - returns the names of the rows and the matrix
+    def solutionMatrix(self, solutions=None, elements="variables", value="activity"):
+        if self.__solutions is None or self.__solutions.nrOfSolutions == 0:
+            raise CmplException("No Solution found so far")
+        if solutions is not None:
+            solutions = [s.solution if isinstance(s, Cmpl) else s for s in solutions]
+        return self.__solutions.solutionMatrix(solutions, elements, value)
+    # *********** end solutionMatrix ******
    
     # *********** saveCmplMessageFile ************
     def saveCmplMessageFile(self, msgFileName=None):
@@ -1212,165 +1332,112 @@ class Cmpl(threading.Thread):
     # *********** end cleanUp ************
 
     # *********** writeCmplDataFile *******
-    def __cmplDataElements(self):
-        try:
-            for s in self.__setList:          
-                self.__cmplDataStr.write("%" + s.name)
+    def __cmplDataElements(self, dataStream=None):
+        for p in self.__parameterList:
+            for s in p.setList:
+                setFound = False
+                for j in self.__setList:
+                    if j.name == s.name:
+                        setFound = True
+                        break
+                if not setFound:
+                    raise CmplException(
+                        "The set " + s.name + " used for the parameter " + p.name + " doesn't exist.")
+
+        if not self.__setList and not self.__parameterList:
+            return 0
 
-                if s.rank > 1:
-                    self.__cmplDataStr.write(' set[' + str(s.rank) + '] < ')
-                else:
-                    self.__cmplDataStr.write(' set < ')
-
-                if s.type == 0:
-                    self.__cmplDataStr.write('\n')
-                    count = 1
-                    for i in s.valueList:
-                        if type(i) == str:
-                            self.__cmplDataStr.write("\"" + i + '\" ')
-                        elif type(i) == float:
-                            self.__cmplDataStr.write(str(int(i)) + ' ')
-                        elif (type(i) == int or type(i) == int):
-                            self.__cmplDataStr.write(str(i) + ' ')
-                        else:
-                            self.__cmplDataStr.write("\"" + str(i) + "\" ")
-                        if count == s.rank:
-                            self.__cmplDataStr.write('\n')
-                            count = 1
-                        else:
-                            count += 1
-
-                if s.type == 1:
-                    self.__cmplDataStr.write('\n')
-                    for i in s.valueList:
-                        for j in i:
-                            if type(j) == list:
-                                raise CmplException("set " + s.name + " contains unexpected data " + str(j))
-                            if type(j) == str:
-                                self.__cmplDataStr.write("\"" + j + "\" ")
-                            elif type(j) == float:
-                                self.__cmplDataStr.write(str(int(j)) + ' ')
-                            elif (type(j) == int or type(j) == int):
-                                self.__cmplDataStr.write(str(j) + ' ')
-                            else:
-                                self.__cmplDataStr.write("\"" + str(j) + "\" ")
-                        self.__cmplDataStr.write('\n')
-
-                if s.type == 2:
-                    self.__cmplDataStr.write(str(s.valueList[0]) + '..' + str(s.valueList[1]) + ' ')
-
-                if s.type == 3:
-                    self.__cmplDataStr.write(
-                        str(s.valueList[0]) + '(' + str(s.valueList[1]) + ')' + str(s.valueList[2]) + ' ')
-
-                self.__cmplDataStr.write('>\n')
-
-            for p in self.__parameterList:
-                self.__cmplDataStr.write('%' + p.name)
-
-                if p.rank > 0:
-                    self.__cmplDataStr.write("[")
-
-                    pos = 0
-                    for s in p.setList:
-                        setFound = False
-                        for j in self.__setList:
-                            if j.name == s.name:
-                                setFound = True
-                                break
-                        if not setFound:
-                            raise CmplException(
-                                "The set " + s.name + " used for the parameter " + p.name + " doesn't exist.")
-                        else:
-                            self.__cmplDataStr.write(s.name)
-                            if pos < len(p.setList) - 1:
-                                self.__cmplDataStr.write(",")
-                            pos += 1
-
-                    self.__cmplDataStr.write('] ')
-
-                    if 'LIST' in str(type(p.values)).upper():
-                        # if type(p.values)==list:
-                        self.__cmplDataStr.write(' <\n')
-                        for e in p.values:
-                            if type(e) == list:
-                                self.__cmplDataStr.write(self.__writeListElements(e))
-                            else:
-                                if type(e) == str:
-                                    self.__cmplDataStr.write('\"' + e + "\" \n")
-                                else:
-                                    self.__cmplDataStr.write(str(e) + '\n')
-
-                    elif 'DICT' in str(type(p.values)).upper():
-                        if p.defaultValue != None:
-
-                            if type(p.defaultValue) == str:
-                                self.__cmplDataStr.write(' = \"' + p.defaultValue + '\" ')
-                            else:
-                                self.__cmplDataStr.write(' = ' + str(p.defaultValue) + ' ')
-
-                        self.__cmplDataStr.write(' indices <\n')
-
-                        for e in p.values:
-
-                            if type(e) == tuple:
-                                for i in e:
-                                    if type(i) == str:
-                                        self.__cmplDataStr.write("\"" + i + '\" ')
-                                    elif type(i) == float:
-                                        self.__cmplDataStr.write(str(int(i)) + ' ')
-                                    else:
-                                        self.__cmplDataStr.write(str(i) + ' ')
-                            elif type(e) == str:
-                                self.__cmplDataStr.write('\"' + e + "\" ")
-                            elif type(e) == float:
-                                self.__cmplDataStr.write(str(int(e)) + ' ')
-                            else:
-                                self.__cmplDataStr.write(str(e) + ' ')
-
-                            if type(p.values[e]) == str:
-                                self.__cmplDataStr.write('\"' + p.values[e] + "\" \n")
-                            else:
-                                self.__cmplDataStr.write(str(p.values[e]) + '\n')
-
-                    self.__cmplDataStr.write(">\n")
+        try:
+            if dataStream is None:
+                f = open(self.__cmplDataFile, 'w')
+            else:
+                f = dataStream
 
-                else:
-                    self.__cmplDataStr.write(" < ")
-                    if type(p.values[0]) == str:
-                        self.__cmplDataStr.write('\"' + p.values[0] + "\" >\n")
+            dataPool = None
+            try:
+                dataWriter = CmplDataWriter(f)
+                elements = [(s, dataWriter.writeSet) for s in self.__setList]
+                elements += [(p, dataWriter.writeParameter) for p in self.__parameterList]
+
+                # uncached elements are formatted by worker processes if requested
+                # parameters defined by an iterator are always written directly
+                blocks = {}
+                if self.__dataWorkers > 1:
+                    pending = [e for e, wf in elements if self.__cachedDataBlock(e) is None
+                               and not (type(e) == CmplParameter and e.isStream)]
+                    if len(pending) > 1:
+                        dataPool = concurrent.futures.ProcessPoolExecutor(max_workers=min(self.__dataWorkers, len(pending)))
+                        for e in pending:
+                            blocks[e] = dataPool.submit(CmplDataWriter.formatElement, e)
+
+                for elem, writeFunc in elements:
+                    if elem in blocks:
+                        block = blocks.pop(elem).result()
+                        dataWriter.write(block)
+                        cache, limit = self.__elementCache(elem)
+                        if cache is not None:
+                            cache.put(elem, block, limit)
                     else:
-                        self.__cmplDataStr.write(str(p.values[0]) + " >\n")
-
-            if self.__cmplDataStr.getvalue() != "":
-                if self.__remoteMode:
-                    pass
-                else:
-                    f = open(self.__cmplDataFile, 'w')
-                    f.write(self.__cmplDataStr.getvalue())
+                        self.__writeDataElement(dataWriter, elem, writeFunc)
+                dataWriter.flush()
+            finally:
+                if dataPool is not None:
+                    dataPool.shutdown(cancel_futures=True)
+                if dataStream is None:
                     f.close()
 
+            return dataWriter.dataLen
+
         except IOError as e:
-            raise CmplException("IO error for cmplDateFile " + self.__cmplDataFile + ": " + e.strerror)
+            raise CmplException("IO error for cmplDateFile " + str(self.__cmplDataFile) + ": " + e.strerror)
     # *********** end writeCmplDataFile ***
 
-    # *********** writeListElements *******
-    def __writeListElements(self, valList):
-        tmpStr = io.StringIO()
-        for v in valList:
-            if type(v) == list:
-                tmpStr.write(self.__writeListElements(v))
-            else:
-                if type(v) == str:
-                    tmpStr.write('\"' + v + '\" ')
-                else:
-                    tmpStr.write(str(v) + ' ')
-        tmpStr.write('\n')
-        tStr = tmpStr.getvalue()
-        tmpStr.close()
-        return tStr
+    # *********** elementCache ************
+    # frozen elements are shared with all other Cmpl objects of the process,
+    # other elements are cached for this object only if a cache limit is set
+    def __elementCache(self, elem):
+        if elem.isFrozen:
+            return cmplDataCache, CMPL_DATA_SHARED_LIMIT
+        if self.__dataCacheLimit > 0:
+            return self.__dataCache, self.__dataCacheLimit
+        return None, 0
+    # *********** end elementCache ********
+
+    # *********** cachedDataBlock *********
+    def __cachedDataBlock(self, elem):
+        cache, limit = self.__elementCache(elem)
+        if cache is None:
+            return None
+        return cache.get(elem)
+    # *********** end cachedDataBlock *****
+
+    # *********** writeDataElement ********
+    def __writeDataElement(self, dataWriter, elem, writeFunc):
+        cache, limit = self.__elementCache(elem)
+        if cache is None:
+            writeFunc(elem)
+            return
+
+        block = cache.reserve(elem)
+        if block is not None:
+            dataWriter.write(block)
+            return
 
-    # *********** end __writeListElements ****
+        try:
+            dataWriter.beginBlock(limit)
+            writeFunc(elem)
+            block = dataWriter.endBlock()
+        finally:
+            cache.release(elem, block, limit)
+    # *********** end writeDataElement ****
+
+    # *********** newSolutions ************
+    def __newSolutions(self, solFile=None):
+        solutions = CmplSolutions(solFile, self.__columnarSolution)
+        solutions.setFilter(*self.__solutionFilter)
+        solutions.setWorkers(self.__solutionWorkers)
+        return solutions
+    # *********** end newSolutions ********
 
     # *********** __solByNr ***************
     def __solByNr(self, solNr):
@@ -1385,73 +1452,73 @@ class Cmpl(threading.Thread):
     # *********** end __solByNr ***********
 
     # *********** getElementByName ***********
-    def __getElementByName(self, name, solObj):
+    def __getElementByName(self, name, nameIndex):
         if self.__solutions.nrOfSolutions > 0:
-            solElements = []
-            solElement = None
-            isArray = False
-            isFound = False
-
-            for e in solObj:
-                if e.name.startswith(name):
-                    if e.name.find("[") != -1:
-                        if e.name.split('[')[0] == name:
-                            isArray = True
-                            solElements.append(e)
-                            isFound = True
-                    else:
-                        if e.name == name:
-                            isArray = False
-                            solElement = e
-                            isFound = True
-
-            if not isFound:
+            elem = nameIndex.find(name)
+            if elem is None:
                 raise CmplException(name + " does not exist.")
-            if isArray:
-                return solElements
-            else:
-                return solElement
+            return elem
         else:
             raise CmplException("No Solution found so far")
     # *********** end getElementByName *****
 
-    # *********** elementByName ***********
-    def __elementByName(self, solObj):
-        elemFound = []
-
-        for e in solObj:
-            tmpName = ""
-            tmpSet = ""
-            pos = e.name.find("[")
-
-            if pos != -1:
-                tmpName = e.name[:pos]
-                if not tmpName in elemFound:
-                    exec ("self." + tmpName + "=collections.OrderedDict()")
-                    elemFound.append(tmpName)
-
-                tmpSet = e.name[pos + 1:-1].split(',')
-                tmpSetStr = io.StringIO()
-                tmpSetStr.write("(")
-                sNr = 1
-                for s in tmpSet:
-                    if sNr > 1:
-                        tmpSetStr.write(",")
-                    if CmplTools.strIsNumber(s):
-                        tmpSetStr.write(s)
-                    else:
-                        tmpSetStr.write("\"" + s + "\"")
-                    sNr += 1
-                tmpSetStr.write(")")
-
-                exec ("self." + tmpName + "[" + tmpSetStr.getvalue() + "] = e")
-                tmpSetStr.close()
+    # *********** getattr ***************
+    # variables and constraints of the solution chosen by varByName and conByName are
+    # provided as attributes, the dict of an indexed element is created on first access
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if self.__solutions is not None and self.__solutions.nrOfSolutions > 0:
+            if self.__varNamesSolNr is not None:
+                elem = self.__elementByName(name, self.__varNames, self.__solByNr(self.__varNamesSolNr).varNameIndex)
+                if elem is not None:
+                    return elem
+            if self.__conNamesSolNr is not None:
+                elem = self.__elementByName(name, self.__conNames, self.__solByNr(self.__conNamesSolNr).conNameIndex)
+                if elem is not None:
+                    return elem
+
+        raise AttributeError("'Cmpl' object has no attribute '" + name + "'")
+    # *********** end getattr ***********
 
-            else:
-                tmpName = e.name
-                exec ("self." + tmpName + "=e")
+    # *********** elementByName ***********
+    def __elementByName(self, name, elemDicts, nameIndex):
+        elemDict = elemDicts.get(name)
+        if elemDict is not None:
+            return elemDict
+
+        if name in nameIndex.families:
+            elemDict = collections.OrderedDict()
+            for e in nameIndex.find(name):
+                elemDict[self.__elementKey(e.name)] = e
+            elemDicts[name] = elemDict
+            return elemDict
+
+        return nameIndex.find(name)
     # *********** end elementByName *******
 
+    # *********** elementKey **************
+    # x[1,a] -> (1,"a") , x[2] -> 2
+    @staticmethod
+    def __elementKey(elemName):
+        key = []
+        for s in elemName[elemName.find("[") + 1:-1].split(','):
+            if CmplTools.strIsNumber(s):
+                try:
+                    s = int(s)
+                except ValueError:
+                    try:
+                        s = float(s)
+                    except ValueError:
+                        pass
+            key.append(s)
+
+        if len(key) == 1:
+            return key[0]
+        return tuple(key)
+    # *********** end elementKey **********
+
     # *********** __handleOutput ************
     def __handleOutput(self, oStr):
         if type(oStr)==bytes:
@@ -0,0 +1,477 @@
+#***********************************************************************
+ #  This code is part of pyCMPL
+ #
+ #  Copyright (C)
+ #  Mike Steglich - Technical University of Applied Sciences
+ #  Wildau, Germany
+ #
+ #  pyCMPL is a project of the Technical University of
+ #  Applied Sciences Wildau and the Institute for Operations Research
+ #  and Business Management at the Martin Luther University
+ #  Halle-Wittenberg.
+ #  Please visit the project homepage <www.coliop.org>
+ #
+ #  pyCMPL is free software; you can redistribute it and/or modify it
+ #  under the terms of the GNU Lesser General Public License as published by
+ #  the Free Software Foundation; either version 3 of the License, or
+ #  (at your option) any later version.
+ #
+ #  pyCMPL is distributed in the hope that it will be useful, but WITHOUT
+ #  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+ #  or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public
+ #  License for more details.
+ #
+ #  You should have received a copy of the GNU Lesser General Public License
+ #  along with this program; if not, see <http://www.gnu.org/licenses/>.
+ #
+ #**********************************************************************
+
+from .CmplException import *
+from .CmplSet import *
+from .CmplParameter import *
+
+import io
+import threading
+import weakref
+from itertools import islice
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# size of the chunks (in characters) that are handed over to the target stream
+CMPL_DATA_CHUNK_SIZE = 1024 * 1024
+
+# maximal size (in characters) of a formatted set or parameter that is cached
+# for the next solve, 0 disables the cache (see Cmpl.setDataCacheLimit)
+CMPL_DATA_CACHE_LIMIT = 0
+
+# maximal size (in characters) of a formatted frozen set or parameter that is 
+# shared by all Cmpl objects of the process
+CMPL_DATA_SHARED_LIMIT = 16 * 1024 * 1024
+
+# number of array elements that are formatted at once
+CMPL_DATA_ARRAY_CHUNK = 64 * 1024
+
+
+#*************** CmplDataWriter ***********************************
+class CmplDataWriter(object):
+
+    #*********** constructor **********
+    def __init__(self, stream, chunkSize=CMPL_DATA_CHUNK_SIZE):
+        self.__stream = stream
+        self.__chunkSize = chunkSize
+        self.__buffer = []
+        self.__bufferLen = 0
+        self.__dataLen = 0
+        self.__block = None
+        self.__blockLen = 0
+        self.__blockMaxLen = 0
+    #*********** end constructor ******
+
+    # getter **************************
+    @property
+    def dataLen(self):
+        return self.__dataLen
+    # end getter ***********************
+
+    #*********** write ****************
+    def write(self, dataStr):
+        self.__buffer.append(dataStr)
+        self.__bufferLen += len(dataStr)
+        if self.__bufferLen >= self.__chunkSize:
+            self.flush()
+    #*********** end write ************
+
+    #*********** flush ****************
+    def flush(self):
+        if self.__bufferLen > 0:
+            chunk = "".join(self.__buffer)
+            self.__stream.write(chunk)
+            self.__dataLen += self.__bufferLen
+
+            if self.__block is not None:
+                self.__blockLen += self.__bufferLen
+                if self.__blockLen <= self.__blockMaxLen:
+                    self.__block.append(chunk)
+                else:
+                    self.__block = None
+
+        self.__buffer = []
+        self.__bufferLen = 0
+    #*********** end flush ************
+
+    #*********** beginBlock ***********
+    # the text written until endBlock is collected as long as it does not
+    # exceed maxLen characters
+    def beginBlock(self, maxLen):
+        self.flush()
+        self.__block = []
+        self.__blockLen = 0
+        self.__blockMaxLen = maxLen
+    #*********** end beginBlock *******
+
+    #*********** endBlock *************
+    # returns the collected text or None if the block was too large
+    def endBlock(self):
+        self.flush()
+        block = None
+        if self.__block is not None:
+            block = "".join(self.__block)
+        self.__block = None
+        self.__blockLen = 0
+        return block
+    #*********** end endBlock *********
+
+    #*********** formatElement ********
+    # formats a set or a parameter into a string, used by the worker processes
+    # if the data elements are formatted in parallel
+    @staticmethod
+    def formatElement(elem):
+        f = io.StringIO()
+        dataWriter = CmplDataWriter(f)
+        if isinstance(elem, CmplSet):
+            dataWriter.writeSet(elem)
+        else:
+            dataWriter.writeParameter(elem)
+        dataWriter.flush()
+        return f.getvalue()
+    #*********** end formatElement ****
+
+    #*********** writeSet *************
+    def writeSet(self, s):
+        write = self.write
+
+        write("%" + s.name)
+
+        if s.rank > 1:
+            write(' set[' + str(s.rank) + '] < ')
+        else:
+            write(' set < ')
+
+        if s.type == 0:
+            write('\n')
+            count = 1
+            for i in s.valueList:
+                write(self.__indexStr(i))
+                if count == s.rank:
+                    write('\n')
+                    count = 1
+                else:
+                    count += 1
+
+        elif s.type == 1:
+            write('\n')
+            for i in zip(*s.columns):
+                write("".join(map(self.__indexStr, i)) + '\n')
+
+        elif s.type == 2:
+            write(str(s.valueList[0]) + '..' + str(s.valueList[1]) + ' ')
+
+        elif s.type == 3:
+            write(str(s.valueList[0]) + '(' + str(s.valueList[1]) + ')' + str(s.valueList[2]) + ' ')
+
+        write('>\n')
+    #*********** end writeSet *********
+
+    #*********** writeParameter *******
+    def writeParameter(self, p):
+        write = self.write
+
+        write('%' + p.name)
+
+        if p.rank > 0:
+            write("[" + ",".join([s.name for s in p.setList]) + '] ')
+
+            if np is not None and isinstance(p.values, np.ndarray):
+                write(' <\n')
+                self.__writeArray(p.values)
+
+            elif p.isStream or p.isSeries or 'DICT' in str(type(p.values)).upper():
+                if p.defaultValue != None:
+                    write(' = ' + self.__valueStr(p.defaultValue) + ' ')
+
+                write(' indices <\n')
+
+                if p.isSeries:
+                    self.__writeSeries(p)
+                else:
+                    self.__writeIndexedValues(p)
+
+            elif 'LIST' in str(type(p.values)).upper():
+                write(' <\n')
+                for e in p.values:
+                    if type(e) == list:
+                        self.__writeListElements(e)
+                    else:
+                        write(self.__valueLine(e))
+
+            write(">\n")
+
+        else:
+            write(" < " + self.__valueStr(p.values[0]) + " >\n")
+    #*********** end writeParameter ***
+
+    #*********** writeIndexedValues ***
+    # the (key, value) pairs are grouped in chunks and every chunk whose key
+    # positions and values are of uniform types is formatted with one format string
+    def __writeIndexedValues(self, p):
+        items = iter(p.items())
+        while True:
+            chunk = list(islice(items, CMPL_DATA_ARRAY_CHUNK))
+            if not chunk:
+                break
+
+            if set(map(type, chunk)) != {tuple} or set(map(len, chunk)) != {2}:
+                raise CmplException("Unexpected data for paramter " + p.name + " : (key, value) pairs expected")
+
+            keys = list(map(itemgetter(0), chunk))
+            keyTypes = set(map(type, keys))
+            keyFormats = None
+
+            if keyTypes == {tuple}:
+                keyLens = set(map(len, keys))
+                if len(keyLens) == 1:
+                    keyFormats = [self.__keyFormat(set(map(type, map(itemgetter(j), keys)))) for j in range(keyLens.pop())]
+            else:
+                keyFormats = [self.__keyFormat(keyTypes)]
+
+            valFormat = self.__valueFormat(set(map(type, map(itemgetter(1), chunk))))
+
+            if keyFormats is None or None in keyFormats or valFormat is None:
+                self.write("".join([self.__keyTupleStr(k) + self.__valueLine(v) for k, v in chunk]))
+            else:
+                fmt = "".join(keyFormats) + valFormat
+                if keyTypes == {tuple}:
+                    self.write("".join([fmt % (k + (v,)) for k, v in chunk]))
+                else:
+                    self.write("".join(map(fmt.__mod__, chunk)))
+    #*********** end writeIndexedValues
+
+    #*********** writeSeries **********
+    # the keys of a pandas series are formatted once per level value and
+    # joined column-wise with the formatted values
+    def __writeSeries(self, p):
+        for cols, values in p.seriesChunks(self.__keyStr):
+            if values.dtype.kind in ('i', 'u', 'f'):
+                cols.append(map(str, values.tolist()))
+                self.write("\n".join(map("".join, zip(*cols))) + "\n")
+            else:
+                cols.append(map(self.__valueLine, values.tolist()))
+                self.write("".join(map("".join, zip(*cols))))
+    #*********** end writeSeries ******
+
+    #*********** keyFormat ************
+    @staticmethod
+    def __keyFormat(colTypes):
+        if colTypes == {str}:
+            return '\"%s\" '
+        elif colTypes <= {int, float}:
+            return '%d '
+        return None
+    #*********** end keyFormat ********
+
+    #*********** valueFormat **********
+    @staticmethod
+    def __valueFormat(colTypes):
+        if colTypes == {str}:
+            return '\"%s\" \n'
+        elif not str in colTypes:
+            return '%s\n'
+        return None
+    #*********** end valueFormat ******
+
+    #*********** writeListElements ****
+    def __writeListElements(self, valList):
+        for v in valList:
+            if type(v) == list:
+                self.__writeListElements(v)
+            elif type(v) == str:
+                self.write('\"' + v + '\" ')
+            else:
+                self.write(str(v) + ' ')
+        self.write('\n')
+    #*********** end writeListElements
+
+    #*********** writeArray ***********
+    # writes a numpy array in the same layout as the equivalent nested list
+    def __writeArray(self, arr):
+        if arr.dtype.kind == 'U':
+            toStr = None
+            sep, lead, end = '\" \"', '\"', '\" \n'
+        else:
+            # python floats and ints are formatted by the C implementation of str(),
+            # other precisions are formatted by numpy to avoid representation noise
+            if arr.dtype.kind in ('i', 'u') or arr.dtype == np.float64:
+                toStr = str
+            else:
+                arr = arr.astype(str)
+                toStr = None
+            sep, lead, end = ' ', '', ' \n'
+
+        if arr.ndim <= 1:
+            arr = arr.reshape(-1)
+            if sep == ' ':
+                sep, end = '\n', '\n'
+            else:
+                sep = '\" \n\"'
+
+            for start in range(0, arr.size, CMPL_DATA_ARRAY_CHUNK):
+                tokens = arr[start:start + CMPL_DATA_ARRAY_CHUNK].tolist()
+                if toStr is not None:
+                    tokens = map(toStr, tokens)
+                self.write(lead + sep.join(tokens) + end)
+            return
+
+        rows = arr.reshape(-1, arr.shape[-1])
+
+        # sizes of the sub-blocks (in rows) after which an additional line break follows
+        blockSizes = []
+        for k in range(1, arr.ndim - 1):
+            bSize = 1
+            for d in arr.shape[k:-1]:
+                bSize *= d
+            blockSizes.append(bSize)
+
+        rowChunk = max(1, CMPL_DATA_ARRAY_CHUNK // max(1, arr.shape[-1]))
+        for start in range(0, rows.shape[0], rowChunk):
+            lines = []
+            r = start
+            for row in rows[start:start + rowChunk].tolist():
+                if toStr is not None:
+                    row = map(toStr, row)
+                lines.append(lead + sep.join(row) + end)
+                r += 1
+                for bSize in blockSizes:
+                    if r % bSize == 0:
+                        lines.append('\n')
+            self.write("".join(lines))
+    #*********** end writeArray *******
+
+    #*********** indexStr *************
+    @staticmethod
+    def __indexStr(i):
+        if type(i) == str:
+            return "\"" + i + "\" "
+        elif type(i) == float:
+            return str(int(i)) + ' '
+        elif type(i) == int:
+            return str(i) + ' '
+        else:
+            return "\"" + str(i) + "\" "
+    #*********** end indexStr *********
+
+    #*********** keyStr ***************
+    @staticmethod
+    def __keyStr(i):
+        if type(i) == str:
+            return "\"" + i + "\" "
+        elif type(i) == float:
+            return str(int(i)) + ' '
+        else:
+            return str(i) + ' '
+    #*********** end keyStr ***********
+
+    #*********** keyTupleStr **********
+    @staticmethod
+    def __keyTupleStr(key):
+        if type(key) == tuple:
+            return "".join(map(CmplDataWriter.__keyStr, key))
+        else:
+            return CmplDataWriter.__keyStr(key)
+    #*********** end keyTupleStr ******
+
+    #*********** valueStr *************
+    @staticmethod
+    def __valueStr(v):
+        if type(v) == str:
+            return '\"' + v + '\"'
+        else:
+            return str(v)
+    #*********** end valueStr *********
+
+    #*********** valueLine ************
+    @staticmethod
+    def __valueLine(v):
+        if type(v) == str:
+            return '\"' + v + "\" \n"
+        else:
+            return str(v) + '\n'
+    #*********** end valueLine ********
+
+#*************** end CmplDataWriter *******************************
+
+
+#*************** CmplDataCache ************************************
+# cache of formatted sets and parameters
+# - the blocks are keyed by the element and are valid as long as its version is unchanged
+# - an entry is dropped as soon as its element is garbage collected
+# - an element is formatted only once even if several threads request it at the same time
+class CmplDataCache(object):
+
+    #*********** constructor **********
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__blocks = weakref.WeakKeyDictionary()
+        self.__pending = {}
+    #*********** end constructor ******
+
+    #*********** get ******************
+    def get(self, elem):
+        with self.__lock:
+            entry = self.__blocks.get(elem)
+        if entry is not None and entry[0] == elem.version:
+            return entry[1]
+        return None
+    #*********** end get **************
+
+    #*********** reserve **************
+    # returns the cached block of the element or None, in the latter case the
+    # caller has to format the element and to hand over the result to release
+    def reserve(self, elem):
+        while True:
+            with self.__lock:
+                entry = self.__blocks.get(elem)
+                if entry is not None and entry[0] == elem.version:
+                    return entry[1]
+
+                pending = self.__pending.get(elem)
+                if pending is None or pending[0] != elem.version:
+                    self.__pending[elem] = (elem.version, threading.Event())
+                    return None
+
+            pending[1].wait()
+    #*********** end reserve **********
+
+    #*********** release **************
+    def release(self, elem, block, maxLen):
+        self.put(elem, block, maxLen)
+        with self.__lock:
+            pending = self.__pending.pop(elem, None)
+        if pending is not None:
+            pending[1].set()
+    #*********** end release **********
+
+    #*********** put ******************
+    # a block that is None or larger than maxLen removes the element from the cache
+    def put(self, elem, block, maxLen):
+        with self.__lock:
+            if block is not None and 0 < len(block) <= maxLen:
+                self.__blocks[elem] = (elem.version, block)
+            else:
+                self.__blocks.pop(elem, None)
+    #*********** end put **************
+
+    #*********** clear ****************
+    def clear(self):
+        with self.__lock:
+            self.__blocks.clear()
+    #*********** end clear ************
+
+#*************** end CmplDataCache ********************************
+
+
+# process-wide cache of frozen sets and parameters
+cmplDataCache = CmplDataCache()
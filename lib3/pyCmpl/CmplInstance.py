@@ -34,6 +34,9 @@ from xml.sax.saxutils import unescape, escape
 
 from .CmplException import *
 
+# size of the chunks (in characters) that are read from a data stream
+CMPL_INSTANCE_CHUNK_SIZE = 1024 * 1024
+
 #*************** CmplInstance ***********************************
 class CmplInstance(object):
 
@@ -142,6 +145,15 @@ class CmplInstance(object):
 			self.__optionsList.append("-basename "+self.__cmplAlias)
 			
 		
+	#*********** writeStream **********
+	def __writeStream(self, stream):
+		while True:
+			chunk = stream.read(CMPL_INSTANCE_CHUNK_SIZE)
+			if not chunk:
+				break
+			self.__instStr.write(escape(chunk))
+	#*********** end writeStream ******
+
 	#*********** cmplInstanceStr **********
 	def cmplInstanceStr(self, cmplFileName, cmplArgs, optList, dataString, jobId):
 
@@ -150,6 +162,11 @@ class CmplInstance(object):
 
 		self.__optionsList = optList
 		self.__jobId = jobId
+		# dataString is a string or a stream (file object) that contains the cmplData, the data is
+		# copied chunk-wise into the instance
+		# - the instance itself is returned as one string since it is sent to the CmplServer via XML-RPC
+		if dataString is None:
+			dataString = ""
 		self.__dataString = dataString
 
 		self.__getExternalFiles()
@@ -173,7 +190,10 @@ class CmplInstance(object):
 			
 			for d in self.__cmplFileList:
 				self.__instStr.write("<file name=\""+ d + "\">\n")
-				self.__instStr.write(escape(self.__cmplFileList[d]) )
+				if type(self.__cmplFileList[d]) == str:
+					self.__instStr.write(escape(self.__cmplFileList[d]) )
+				else:
+					self.__writeStream(self.__cmplFileList[d])
 				self.__instStr.write("\n")	
 				self.__instStr.write("</file>\n")
 			self.__instStr.write("</problemFiles>\n")	
@@ -34,16 +34,29 @@ from xml.sax.saxutils import unescape
 
 from .CmplDefs import *
 from .CmplException import *
+from .CmplTools import *
 
 
 #*************** CmplMsg *****************************************
 class CmplMsg(object):
+	
+	__slots__ = ('__type', '__module', '__location', '__description')
+	
 	def __init__(self):
 		self.__type = ""
 		self.__module = ""
 		self.__location = ""
 		#self.__line = ""
 		self.__description = ""
+	
+	#*********** pickle ***************
+	def __getstate__(self):
+		return CmplTools.slotsState(self)
+	
+	def __setstate__(self, state):
+		self.__init__()
+		CmplTools.setSlotsState(self, state)
+	#*********** end pickle ***********
 		
 	# getter and setter 	
 	@property
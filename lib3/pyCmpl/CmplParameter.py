@@ -27,11 +27,20 @@
  #**********************************************************************
 
 from math import *
+import collections.abc
+import numbers
 
 from .CmplException import *
 from .CmplTools import *
 from .CmplSet import *
 
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+# number of elements of a pandas series that are converted at once
+CMPL_PARAMETER_CHUNK = 64 * 1024
 		
 #*************** CmplParameter ***********************************		
 class CmplParameter(object):
@@ -44,6 +53,11 @@ class CmplParameter(object):
 		self.__valueList = []
 		self.__count=1
 		self.__defaultVal=None
+		self.__isStream=False
+		self.__isSeries=False
+		self.__streamConsumed=False
+		self.__version = 0
+		self.__isFrozen = False
 		
 		defSets=None
 		
@@ -75,24 +89,93 @@ class CmplParameter(object):
 	#*********** End constructor ****
 	
 	#*********** valueCount *********	
+	# checks that a nested list is a regular array of scalar values and returns its number of elements
 	def __countElements(self, vList):
-		_count=len(vList)
-		if type(vList[0]) == list:
-			_count *= self.__countElements(vList[0])
+		if np is not None:
+			try:
+				arr = np.array(vList)
+			except ValueError:
+				arr = None
+			if arr is not None and arr.dtype.kind in ('i', 'u', 'f', 'U', 'b') and arr.ndim == len(self.__listShape(vList)):
+				return arr.size
+		
+		shape = self.__listShape(vList)
+		self.__checkListElements(vList, shape, ())
+		_count = 1
+		for n in shape:
+			_count *= n
 		return _count
+	
+	def __listShape(self, vList):
+		shape = []
+		v = vList
+		while type(v) == list:
+			if len(v) == 0:
+				raise CmplException("The values of the paramter <"+ self.__name +"> contain an empty list at index " + self.__indexStr((0,) * len(shape)) )
+			shape.append(len(v))
+			v = v[0]
+		return shape
+	
+	def __checkListElements(self, vList, shape, index):
+		if type(vList) != list or len(vList) != shape[0]:
+			raise CmplException("The values of the paramter <"+ self.__name +"> are not a regular array : unexpected element at index " + self.__indexStr(index) + " : " + str(vList)[:80] )
+		
+		if len(shape) > 1:
+			for i, e in enumerate(vList):
+				self.__checkListElements(e, shape[1:], index + (i,))
+		elif not set(map(type, vList)) <= {int, float, str}:
+			for i, e in enumerate(vList):
+				if not (type(e) == str or isinstance(e, numbers.Real)):
+					raise CmplException("The values of the paramter <"+ self.__name +"> are not a regular array : unexpected element at index " + self.__indexStr(index + (i,)) + " : " + str(e)[:80] )
+	
+	@staticmethod
+	def __indexStr(index):
+		return "".join(["[" + str(i) + "]" for i in index])
 	#*********** end valueCount *****
 		
 	
 	#*********** values *************	
 	def setValues(self, val , defaultVal=None):
+		if self.__isFrozen:
+			raise CmplException("parameter " + self.__name + " is frozen and can't be changed")
+		
 		self.__valueList=[]
+		self.__isStream=False
+		self.__isSeries=False
+		self.__streamConsumed=False
+		self.__version += 1
 		if self.__rank == 0:
 			if not 'LIST' in str(type(val)).upper():
 				self.__valueList.append(val)
 			else:
 				raise CmplException("incompatible data for scalar parameter <"+ self.__name +"> : " + str(val) )
 		else:
-			if  'LIST' in str(type(val)).upper():
+			if np is not None and isinstance(val, np.ndarray):
+				if val.dtype.kind == 'O':
+					val = val.tolist()
+				elif not val.dtype.kind in ('i', 'u', 'f', 'U'):
+					raise CmplException("Unexpected data type for paramter "+ self.__name + " : " + str(val.dtype) )
+
+			if np is not None and isinstance(val, np.ndarray):
+				sCount=1
+				for s in self._setList:
+					sCount*=s.count()
+
+				if val.size != sCount:
+					raise CmplException("The dimension of the paramter <"+ self.__name +"> doesn't match the dimension of the set(s)."  )
+
+				self.__valueList=val
+				self.__count=val.size
+
+			elif isinstance(val, collections.abc.Iterator):
+				#(key, value) pairs that are consumed while the data file is written
+				self.__valueList=val
+				self.__isStream=True
+				self.__count=0
+				if defaultVal!=None:
+					self.__defaultVal=defaultVal
+					
+			elif  'LIST' in str(type(val)).upper():
 				self.__valueList=val
 				sCount=1
 				for s in self._setList:
@@ -120,14 +203,92 @@ class CmplParameter(object):
 					if sCount!=len(val):
 						raise CmplException("The dimension of the paramter "+ self.__name +" doesn't match the dimension of the set(s)."  )
 					
-					if 'LIST' in str(type(list(val.values())[0])).upper() or 'DICT' in str(type(list(val.values())[0])).upper():
+					if 'LIST' in str(type(next(iter(val.values())))).upper() or 'DICT' in str(type(next(iter(val.values())))).upper():
 						raise CmplException("Unexpected data type for paramter "+ self.__name   )
-					
+
 			else:
 				raise CmplException("incompatible data for parameter array <"+ self.__name +"> : " + str(val) )
 	
 	#*********** end values *********
 	
+	#*********** fromSeries *********
+	# creates a parameter from a pandas Series whose index addresses the elements of the set(s)
+	# the series is not copied, the keys are taken chunk-wise from the index while the data file is written
+	@classmethod
+	def fromSeries(cls, name, series, sets, defaultVal=None):
+		p = cls(name, sets)
+		
+		if p.__rank == 0:
+			raise CmplException("parameter <"+ name +"> : a series requires at least one set")
+		if getattr(series.index, 'nlevels', 1) != p.__rank:
+			raise CmplException("The rank of the index of the series doesn't match the rank of the set(s) of the parameter <"+ name +">")
+		if p.__rank > 1 and any((np.asarray(c) < 0).any() for c in series.index.codes):
+			raise CmplException("The index of the series of the parameter <"+ name +"> contains missing values")
+		if series.to_numpy().dtype.kind not in ('i', 'u', 'f', 'U', 'O'):
+			raise CmplException("Unexpected data type for paramter "+ name + " : " + str(series.dtype) )
+		
+		if defaultVal==None:
+			sCount=1
+			for s in p._setList:
+				sCount*=s.count()
+			if sCount!=len(series):
+				raise CmplException("The dimension of the paramter "+ name +" doesn't match the dimension of the set(s)."  )
+		
+		p.__version += 1
+		p.__valueList=series
+		p.__isSeries=True
+		p.__count=len(series)
+		p.__defaultVal=defaultVal
+		return p
+	#*********** end fromSeries *****
+	
+	#*********** seriesChunks *******
+	# the keys and values of a parameter defined by a pandas series in chunks of CMPL_PARAMETER_CHUNK elements
+	# - returns per chunk a list of key columns (one per index level) and the values as numpy array
+	# - the level values of a MultiIndex are converted by keyFunc once and are taken by their codes
+	def seriesChunks(self, keyFunc=None):
+		if not self.__isSeries:
+			raise CmplException("The parameter <"+ self.__name +"> is not defined by a series")
+		
+		index = self.__valueList.index
+		values = self.__valueList.to_numpy()
+		nLevels = getattr(index, 'nlevels', 1)
+		
+		if nLevels > 1:
+			codes = [np.asarray(c) for c in index.codes]
+			if any((c < 0).any() for c in codes):
+				raise CmplException("The index of the series of the parameter <"+ self.__name +"> contains missing values")
+			levelLists = [index.levels[j].tolist() for j in range(nLevels)]
+			if keyFunc is not None:
+				levelLists = [list(map(keyFunc, l)) for l in levelLists]
+		
+		for start in range(0, len(values), CMPL_PARAMETER_CHUNK):
+			stop = start + CMPL_PARAMETER_CHUNK
+			if nLevels > 1:
+				keys = [map(levelLists[j].__getitem__, codes[j][start:stop].tolist()) for j in range(nLevels)]
+			elif keyFunc is not None:
+				keys = [map(keyFunc, index[start:stop].tolist())]
+			else:
+				keys = [index[start:stop].tolist()]
+			yield keys, values[start:stop]
+	#*********** end seriesChunks ***
+	
+	#*********** seriesItems ********
+	def __seriesItems(self):
+		for keys, values in self.seriesChunks():
+			yield from zip(zip(*keys) if len(keys) > 1 else keys[0], values.tolist())
+	#*********** end seriesItems ****
+	
+	#*********** freeze *************
+	# a frozen parameter can't be changed anymore and its formatted data is shared by all 
+	# Cmpl objects of the process - the values passed to setValues must not be 
+	# changed in place afterwards
+	def freeze(self):
+		if self.__isStream:
+			raise CmplException("The parameter <"+ self.__name +"> is defined by an iterator and can't be frozen")
+		self.__isFrozen = True
+	#*********** end freeze *********
+	
 	#*********** setList ************	
 	@property
 	def setList(self) :
@@ -139,6 +300,64 @@ class CmplParameter(object):
 	def values(self):
 		return self.__valueList		
 	#*********** End valueList ******	
+
+	#*********** isStream ***********
+	@property
+	def isStream(self):
+		return self.__isStream
+	#*********** end isStream *******
+
+	#*********** isSeries ***********
+	@property
+	def isSeries(self):
+		return self.__isSeries
+	#*********** end isSeries *******
+
+	#*********** items **************
+	# (key, value) pairs of a parameter defined by a dict, a pandas series or an iterator
+	def items(self):
+		if self.__isStream:
+			if self.__streamConsumed:
+				raise CmplException("The values of the parameter <"+ self.__name +"> have been provided by an iterator that is already consumed")
+			self.__streamConsumed=True
+			return self.__streamItems()
+		elif self.__isSeries:
+			return self.__seriesItems()
+		elif 'DICT' in str(type(self.__valueList)).upper():
+			return self.__valueList.items()
+		else:
+			raise CmplException("The parameter <"+ self.__name +"> is not defined by indices")
+	#*********** end items **********
+	
+	#*********** streamItems ********
+	# the number of elements of a parameter defined by an iterator is known after it is consumed
+	def __streamItems(self):
+		self.__count=0
+		for item in self.__valueList:
+			self.__count+=1
+			yield item
+	#*********** end streamItems ****
+	
+	#*********** pickle *************
+	# the remaining (key, value) pairs of a parameter defined by an iterator are pickled as list,
+	# the parameter itself continues with an iterator over this list
+	def __getstate__(self):
+		state = self.__dict__.copy()
+		if self.__isStream:
+			pairs = []
+			if not self.__streamConsumed:
+				pairs = list(self.__valueList)
+				self.__valueList = iter(pairs)
+			state['_CmplParameter__valueList'] = pairs
+		return state
+	
+	# attributes that are missing in states of older versions keep their default values
+	def __setstate__(self, state):
+		self.__init__(state.get('_CmplParameter__name', ""))
+		self.__dict__.update(state)
+		if self.__isStream:
+			self.__valueList = iter(self.__valueList)
+	#*********** end pickle *********
 		
 	#*********** valueList **********
 	@property
@@ -164,6 +383,19 @@ class CmplParameter(object):
 		return self.__count		
 	#*********** end rank ***********
 
+	#*********** version ************
+	# is incremented every time the values of the parameter are changed
+	@property
+	def version(self):
+		return self.__version
+	#*********** end version ********
+	
+	#*********** isFrozen ***********
+	@property
+	def isFrozen(self):
+		return self.__isFrozen
+	#*********** end isFrozen *******
+
 	#*********** defaultValue ************	
 	@property
 	def defaultValue(self) :
@@ -27,10 +27,17 @@
  #**********************************************************************
 
 from math import *
+from array import array
+import sys
 
 from .CmplException import *
 from .CmplTools import *
 
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
 	
 #*************** CmplSet *****************************************		
 class CmplSet(object):
@@ -41,7 +48,11 @@ class CmplSet(object):
 		self.__name = ""
 		self.__type = 0   # 0 enumeration set - 1 tuple set - 2 alg set n..m - 3 alg set n(k)m
 		self.__valueList = []
-		self.__len = 0
+		self.__columns = ()   # one column per tuple position for tuple sets
+		self.__values = None
+		self.__valueSet = None
+		self.__version = 0
+		self.__isFrozen = False
 		
 		if type(name) != str:
 			raise CmplException("not a valid name for set: " + str(name) )
@@ -60,18 +71,123 @@ class CmplSet(object):
 		if self.__type == 0:  
 			_count = len(self.__valueList)/self.__rank
 		elif self.__type == 1:
-			_count = len(self.__valueList)
-		elif self.__type == 2:
-			_count = self.__valueList[1]-self.__valueList[0]+1
-		elif self.__type == 3:
-			_count = ceil(  (fabs( self.__valueList[2] - self.__valueList[0])  +1 ) / fabs(self.__valueList[1]))
+			_count = len(self.__columns[0])
+		elif self.__type == 2 or self.__type == 3:
+			_count = len(self.__algRange())
 		return _count
 	#*********** end count **********
+	
+	#*********** contains ***********
+	def contains(self, val):
+		if self.__type == 2 or self.__type == 3:
+			if type(val) == float and val.is_integer():
+				val = int(val)
+			elif type(val) != int:
+				return False
+			return val in self.__algRange()
+		else:
+			if self.__valueSet is None:
+				self.__valueSet = set(self.values)
+			if self.__type == 1 and type(val) == list:
+				val = tuple(val)
+			try:
+				return val in self.__valueSet
+			except TypeError:
+				return False
+	#*********** end contains *******
+	
+	#*********** algRange ***********
+	def __algRange(self):
+		if self.__type == 2:
+			return range(self.__valueList[0],self.__valueList[1]+1)
+		elif self.__valueList[1]>0:
+			return range(self.__valueList[0],self.__valueList[2]+1,self.__valueList[1])
+		else:
+			return range(self.__valueList[0],self.__valueList[2]-1,self.__valueList[1])
+	#*********** end algRange *******
+	
+	#*********** tupleColumns *******
+	def __tupleColumns(self, val):
+		if set(map(len, val)) != {self.__rank}:
+			for t in val:
+				if len(t) != self.__rank:
+					raise CmplException("Rank and number of indexing entries for set " + self.__name + " : " + str(t) + " don't match.")
+		
+		columns = []
+		for col in zip(*val):
+			try:
+				columns.append(array('q', col))
+			except (TypeError, OverflowError):
+				tmpCol = []
+				for e in col:
+					if type(e) == str:
+						tmpCol.append(sys.intern(e))
+					elif type(e) == list:
+						raise CmplException("set " + self.__name + " contains unexpected data " + str(e))
+					else:
+						tmpCol.append(e)
+				columns.append(tmpCol)
+		return tuple(columns)
+	#*********** end tupleColumns ***
+	
+	#*********** fromIndex **********
+	# creates a set from a pandas Index or MultiIndex
+	# - a RangeIndex becomes an algebraic set
+	# - a MultiIndex becomes a tuple set whose columns are taken from the level codes
+	@classmethod
+	def fromIndex(cls, name, index):
+		s = cls(name, getattr(index, 'nlevels', 1))
+		
+		if len(index) == 0:
+			raise CmplException("unexpected values for set " + name + " : the index is empty")
+		
+		if s.__rank > 1:
+			columns = []
+			for j in range(s.__rank):
+				codes = np.asarray(index.codes[j])
+				if (codes < 0).any():
+					raise CmplException("set " + name + " contains missing values")
+				
+				levelValues = index.levels[j]
+				if levelValues.dtype.kind in ('i', 'u'):
+					col = array('q')
+					col.frombytes(np.asarray(levelValues, dtype=np.int64).take(codes).tobytes())
+				else:
+					levelList = [sys.intern(e) if type(e) == str else e for e in levelValues.tolist()]
+					col = list(map(levelList.__getitem__, codes.tolist()))
+				columns.append(col)
+			
+			s.__version += 1
+			s.__type = 1
+			s.__columns = tuple(columns)
+		
+		elif type(index).__name__ == 'RangeIndex':
+			last = index.start + (len(index) - 1) * index.step
+			if index.step == 1 or len(index) == 1:
+				s.setValues(index.start, last)
+			else:
+				s.setValues(index.start, index.step, last)
+		
+		else:
+			vals = index.tolist()
+			if type(vals[0]) == tuple:
+				s.__rank = len(vals[0])
+			s.setValues(vals)
+		
+		return s
+	#*********** end fromIndex ******
 		
 			
 	#*********** values *************	
 	def setValues(self, val1, val2=None, val3=None):
+		if self.__isFrozen:
+			raise CmplException("set " + self.__name + " is frozen and can't be changed")
+		
 		self.__valueList = []
+		self.__columns = ()
+		self.__values = None
+		self.__valueSet = None
+		self.__version += 1
 	
 		if val2 == None and val3 == None:
 			if not 'LIST' in str(type(val1)).upper():
@@ -82,13 +198,12 @@ class CmplSet(object):
 					if len(val1[0])!=self.__rank:
 						raise CmplException("Rank and number of indexing entries for set " + self.__name + " : " + str(val1[0]) + " don't match.")
 					self.__type = 1
-					self.__len = len(val1) / self.__rank
+					self.__columns = self.__tupleColumns(val1)
 				else:
 					self.__type = 0
 					if  self.__rank>1:
 						raise CmplException( "incorrect definition of a tuple set " + self.__name)
-				
-				self.__valueList = val1
+					self.__valueList = val1
 	
 		elif val2 != None and val3 == None:
 				self.__type = 2
@@ -122,13 +237,50 @@ class CmplSet(object):
 				raise CmplException( "unexpected values for set " + self.__name + " : "+ str(val1) + "/" + str(val2) + "/" + str(val3) + "is not an valid integer combination")
 	#*********** end values *********
 	
+	#*********** freeze *************
+	# a frozen set can't be changed anymore and its formatted data is shared by all 
+	# Cmpl objects of the process - the values passed to setValues must not be 
+	# changed in place afterwards
+	def freeze(self):
+		self.__isFrozen = True
+	#*********** end freeze *********
+	
+	
+	#*********** pickle *************
+	# tuple sets are pickled as list of tuples in __valueList like in former versions,
+	# the columns are restored from this list when the set is loaded
+	def __getstate__(self):
+		state = self.__dict__.copy()
+		if self.__type == 1:
+			state['_CmplSet__valueList'] = self.values
+		for name in ('__columns', '__values', '__valueSet'):
+			state.pop('_CmplSet' + name, None)
+		return state
+	
+	def __setstate__(self, state):
+		self.__init__(state.get('_CmplSet__name', ""), state.get('_CmplSet__rank', 1))
+		self.__dict__.update(state)
+		if self.__type == 1:
+			self.__columns = self.__tupleColumns(self.__valueList)
+			self.__valueList = []
+	#*********** end pickle *********
+	
 	
 	#*********** valueList **********
 	@property
 	def valueList(self):
+		if self.__type == 1:
+			return self.values
 		return self.__valueList		
 	#*********** End valueList ******	
 	
+	#*********** columns ************
+	# tuple sets only: one array or list per tuple position
+	@property
+	def columns(self):
+		return self.__columns
+	#*********** End columns ********
+	
 	#*********** set **********
 	@property
 	def values(self):
@@ -136,31 +288,23 @@ class CmplSet(object):
 			return self.__valueList		
 			
 		elif self.__type == 1:
-			tmpList=[]
-			for c in self.__valueList:
-				tmpTuple="("
-				
-				for e in range(len(c)):
-					if e>0:
-						tmpTuple=tmpTuple+","
-					if type(c[e])==str:	
-						tmpTuple=tmpTuple+"\""+c[e]+"\""
-					else:
-						tmpTuple=tmpTuple+str(c[e])
-				
-				tmpTuple=tmpTuple+")"	
-				tmpList.append(eval(tmpTuple))
-			
-			return tmpList
+			if self.__values is None:
+				self.__values = list(zip(*self.__columns))
+			return self.__values
 				
-		elif self.__type == 2:
-			return list(range(self.__valueList[0],self.__valueList[1]+1))
-		elif self.__type == 3:
-			if self.__valueList[1]>0:
-				return list(range(self.__valueList[0],self.__valueList[2]+1,self.__valueList[1]))
-			else:
-				return list(range(self.__valueList[0],self.__valueList[2]-1,self.__valueList[1]))
+		elif self.__type == 2 or self.__type == 3:
+			return list(self.__algRange())
 	#*********** End valueList ******	
+	
+	#*********** valueRange *********
+	# the values of an algebraic set as range object that is not expanded to a list,
+	# None for enumeration and tuple sets
+	@property
+	def valueRange(self):
+		if self.__type == 2 or self.__type == 3:
+			return self.__algRange()
+		return None
+	#*********** end valueRange *****
 		
 	#*********** name ***************
 	@property
@@ -180,18 +324,28 @@ class CmplSet(object):
 		return self.__rank		
 	#*********** end rank ***********
 	
+	#*********** version ************
+	# is incremented every time the values of the set are changed
+	@property
+	def version(self):
+		return self.__version
+	#*********** end version ********
+	
+	#*********** isFrozen ***********
+	@property
+	def isFrozen(self):
+		return self.__isFrozen
+	#*********** end isFrozen *******
+	
 	#*********** len ****************
 	@property
 	def len(self):
-		if self.__type == 0 or self.__type == 1:
+		if self.__type == 0:
 			return len(self.__valueList)	
-		elif self.__type == 2:
-			return len(list(range(self.__valueList[0],self.__valueList[1]+1)))
-		elif self.__type == 3:
-			if self.__valueList[1]>0:
-				return len(list(range(self.__valueList[0],self.__valueList[2]+1,self.__valueList[1])))
-			else:
-				return len(list(range(self.__valueList[0],self.__valueList[2]-1,self.__valueList[1])))
+		elif self.__type == 1:
+			return len(self.__columns[0])
+		elif self.__type == 2 or self.__type == 3:
+			return len(self.__algRange())
 	#*********** end len ************
 	
 	
@@ -29,23 +29,79 @@
 import os
 import re
 import io
+import gc
+import sys
+import fnmatch
+import mmap
+import shutil
+import tempfile
+import collections
+import itertools
+import json
+import struct
+import hashlib
+import concurrent.futures
+from array import array
+from operator import attrgetter
 
 from .CmplException import *
+from .CmplTools import *
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+# size of the blocks (in characters) of a solution file that are parsed at once
+CMPL_SOLUTION_CHUNK_SIZE = 1024 * 1024
+
+# minimum size (in bytes) of a solution file whose elements are parsed by several worker processes
+CMPL_SOLUTION_PARALLEL_SIZE = 1024 * 1024 * 1024
+
+# binary solution snapshots: magic bytes, format version and suffix of the sidecar cache of a solution file
+CMPL_SOLUTION_BINARY_MAGIC = b"CMPLSOLB"
+CMPL_SOLUTION_BINARY_VERSION = 1
+CMPL_SOLUTION_CACHE_SUFFIX = ".csolb"
+
+# text elements of the general section of a solution file, their types and the attributes of CmplSolutions they are stored in
+CMPL_SOLUTION_GENERAL = { 'nrOfVariables' : (int, '__nrOfVariables'), 'nrOfConstraints' : (int, '__nrOfConstraints'),
+						  'objectiveName' : (str, '__objectiveName'), 'objectiveSense' : (str, '__objectiveSense'),
+						  'nrOfSolutions' : (int, '__nrOfSolutions'), 'solverName' : (str, '__solverName'), 'solverMsg' : (str, '__solverMsg'),
+						  'variablesDisplayOptions' : (str, '__varDisplayOptions'), 'constraintsDisplayOptions' : (str, '__conDisplayOptions') }
+
+# patterns for the bulk extraction of the elements of a solution file
+# - like in _readSolLine the values of a variable or a constraint are taken in the order of their attributes
+CMPL_SOLUTION_VAR_PATTERN = re.compile('<variable\\s' + '[^"]*"([^"]*)"' * 7)
+CMPL_SOLUTION_CON_PATTERN = re.compile('<constraint\\s' + '[^"]*"([^"]*)"' * 7)
+CMPL_SOLUTION_SOL_PATTERN = re.compile(b'<solution\\s' + b'[^"]*"([^"]*)"' * 3 + b'[^>]*>|</solution>')
+CMPL_SOLUTION_GENERAL_PATTERN = re.compile(b'<(\\w+)>([^"<]*)</\\1>')
 
 #*************** CmplSolElement *************************************
 class CmplSolElement(object):
+	
+	__slots__ = ('__idx', '__name', '__type', '__activity', '__lowerBound', '__upperBound', '__hasMarginal', '__marginal')
+	
 	#*********** constructor **********
-	def __init__(self):
-		self.__idx = 0
-		self.__name = ""
-		self.__type = ""
-		self.__activity = 0
-		self.__lowerBound = 0
-		self.__upperBound = 0
+	def __init__(self, idx=0, name="", type="", activity=0, lowerBound=0, upperBound=0, marginal=0):
+		self.__idx = idx
+		self.__name = name
+		self.__type = type
+		self.__activity = activity
+		self.__lowerBound = lowerBound
+		self.__upperBound = upperBound
 		self.__hasMarginal = False
-		self.__marginal = 0
+		self.__marginal = marginal
 	#*********** end constructor ******
 	
+	#*********** pickle ***************
+	def __getstate__(self):
+		return CmplTools.slotsState(self)
+	
+	def __setstate__(self, state):
+		self.__init__()
+		CmplTools.setSlotsState(self, state)
+	#*********** end pickle ***********
+	
 	# getter and setter 
 	@property
 	def idx(self):
@@ -100,18 +156,354 @@ class CmplSolElement(object):
 		
 #*************** end CmplSolElement ******************************
 
+#*************** CmplSolElements  **********************************
+# columnar store for the variables or the constraints of a solution
+# - the numerical attributes are held in arrays, the types as codes of a category table
+#   and the names as interned strings
+# - the columns are provided as read-only copies in numpy arrays (or as copies in arrays if numpy
+#   is not available), views would lock the arrays of the store against further elements
+# - the copies are kept until the elements are changed, so repeated accesses to a column are cheap
+# - indexing and iterating return CmplSolElement objects that are created on demand
+# - the entries of a solution pool share the invariant columns (idx, name, type and bounds)
+#   with the first solution and hold only their own activities and marginals
+class CmplSolElements(object):
+
+	#*********** constructor **********
+	def __init__(self):
+		self.__idx = array('q')
+		self.__names = []
+		self.__typeCodes = array('B')
+		self.__typeTable = []
+		self.__typeMap = {}
+		self.__activity = array('d')
+		self.__lowerBound = array('d')
+		self.__upperBound = array('d')
+		self.__marginal = array('d')
+		self.__isShared = False
+		self.__columnCache = {}
+	#*********** end constructor ******
+	
+	#*********** pickle ***************
+	# the copies of the columns are not pickled
+	def __getstate__(self):
+		state = self.__dict__.copy()
+		state['_CmplSolElements__columnCache'] = {}
+		return state
+	
+	def __setstate__(self, state):
+		self.__init__()
+		self.__dict__.update(state)
+	#*********** end pickle ***********
+	
+	#*********** shareColumns *********
+	# takes over the invariant columns of the elements of another solution
+	def shareColumns(self, other):
+		self.__init__()
+		self.__idx = other.__idx
+		self.__names = other.__names
+		self.__typeCodes = other.__typeCodes
+		self.__typeTable = other.__typeTable
+		self.__typeMap = other.__typeMap
+		self.__lowerBound = other.__lowerBound
+		self.__upperBound = other.__upperBound
+		self.__isShared = True
+	
+	@property
+	def isShared(self):
+		return self.__isShared
+	
+	# false as long as not all activities and marginals of the shared columns are known
+	@property
+	def isComplete(self):
+		return len(self.__activity) == len(self.__names) and len(self.__marginal) == len(self.__names)
+	
+	def clear(self):
+		self.__init__()
+	#*********** end shareColumns *****
+	
+	#*********** unshare **************
+	def __unshare(self):
+		if self.__isShared:
+			self.__idx = array('q', self.__idx)
+			self.__names = list(self.__names)
+			self.__typeCodes = array('B', self.__typeCodes)
+			self.__typeTable = list(self.__typeTable)
+			self.__typeMap = dict(self.__typeMap)
+			self.__lowerBound = array('d', self.__lowerBound)
+			self.__upperBound = array('d', self.__upperBound)
+			self.__isShared = False
+	#*********** end unshare **********
+	
+	#*********** extendValues *********
+	# adds the activities and marginals of elements whose invariant columns are shared,
+	# returns False if the invariant columns don't match the shared ones
+	def extendValues(self, idx, names, types, activities, lowerBounds, upperBounds, marginals):
+		pos = len(self.__activity)
+		end = pos + len(names)
+		if list(names) != self.__names[pos:end] or array('q', idx) != self.__idx[pos:end]:
+			return False
+		if list(types) != [self.__typeTable[c] for c in self.__typeCodes[pos:end]]:
+			return False
+		if array('d', lowerBounds) != self.__lowerBound[pos:end] or array('d', upperBounds) != self.__upperBound[pos:end]:
+			return False
+		self.__activity.extend(activities)
+		self.__marginal.extend(marginals)
+		self.__columnCache.clear()
+		return True
+	#*********** end extendValues *****
+
+	#*********** rawColumns ***********
+	# the internal columns (idx, names, typeCodes, typeTable, activity, lowerBound, upperBound, marginal)
+	# that are written to and read from binary solution snapshots
+	def rawColumns(self):
+		return (self.__idx, self.__names, self.__typeCodes, self.__typeTable,
+				self.__activity, self.__lowerBound, self.__upperBound, self.__marginal)
+
+	def setRawColumns(self, idx, names, typeCodes, typeTable, activity, lowerBound, upperBound, marginal):
+		self.__init__()
+		self.__idx = idx
+		self.__names = names
+		self.__typeCodes = typeCodes
+		self.__typeTable = typeTable
+		self.__typeMap = dict((t, c) for c, t in enumerate(typeTable))
+		self.__activity = activity
+		self.__lowerBound = lowerBound
+		self.__upperBound = upperBound
+		self.__marginal = marginal
+
+	# activities and marginals of elements whose invariant columns are shared
+	def setValueColumns(self, activity, marginal):
+		self.__activity = activity
+		self.__marginal = marginal
+		self.__columnCache.clear()
+	#*********** end rawColumns *******
+	
+	#*********** typeCode *************
+	def __typeCode(self, t):
+		code = self.__typeMap.get(t)
+		if code is None:
+			code = len(self.__typeTable)
+			self.__typeTable.append(t)
+			self.__typeMap[t] = code
+		return code
+	#*********** end typeCode *********
+	
+	#*********** extendColumns ********
+	def extendColumns(self, idx, names, types, activities, lowerBounds, upperBounds, marginals):
+		self.__unshare()
+		self.__idx.extend(idx)
+		self.__names.extend(map(sys.intern, names))
+		self.__typeCodes.extend(map(self.__typeCode, types))
+		self.__activity.extend(activities)
+		self.__lowerBound.extend(lowerBounds)
+		self.__upperBound.extend(upperBounds)
+		self.__marginal.extend(marginals)
+		self.__columnCache.clear()
+	#*********** end extendColumns ****
+	
+	#*********** append ***************
+	def append(self, e):
+		self.extendColumns([e.idx], [e.name], [e.type], [e.activity], [e.lowerBound], [e.upperBound], [e.marginal])
+	#*********** end append ***********
+	
+	#*********** element **************
+	def __element(self, i):
+		t = self.__typeTable[self.__typeCodes[i]]
+		activity = self.__activity[i]
+		if t=='I' or t=='B':
+			activity = int(activity)
+		return CmplSolElement(self.__idx[i], self.__names[i], t, activity, self.__lowerBound[i], self.__upperBound[i], self.__marginal[i])
+	#*********** end element **********
+	
+	def __len__(self):
+		return len(self.__activity)
+	
+	def __getitem__(self, i):
+		if type(i) == slice:
+			return [self.__element(j) for j in range(*i.indices(len(self)))]
+		if i < 0:
+			i += len(self)
+		if i < 0 or i >= len(self):
+			raise IndexError("solution element index out of range")
+		return self.__element(i)
+	
+	def __iter__(self):
+		for i in range(len(self)):
+			yield self.__element(i)
+	
+	#*********** column ***************
+	def __column(self, key, arr):
+		col = self.__columnCache.get(key)
+		if col is None:
+			if np is not None:
+				col = np.array(arr, dtype=np.int64 if arr.typecode == 'q' else np.float64)
+				col.flags.writeable = False
+			else:
+				col = arr[:]
+			self.__columnCache[key] = col
+		return col
+	#*********** end column ***********
+	
+	# getter 
+	@property
+	def idx(self):
+		return self.__column('idx', self.__idx)
+	
+	@property
+	def names(self):
+		return self.__names
+	
+	@property
+	def types(self):
+		col = self.__columnCache.get('types')
+		if col is None:
+			if np is not None:
+				col = np.array(self.__typeTable, dtype=str)[np.frombuffer(self.__typeCodes, dtype=np.uint8)]
+				col.flags.writeable = False
+			else:
+				col = [self.__typeTable[c] for c in self.__typeCodes]
+			self.__columnCache['types'] = col
+		return col
+	
+	@property
+	def activity(self):
+		return self.__column('activity', self.__activity)
+	
+	@property
+	def lowerBound(self):
+		return self.__column('lowerBound', self.__lowerBound)
+	
+	@property
+	def upperBound(self):
+		return self.__column('upperBound', self.__upperBound)
+	
+	@property
+	def marginal(self):
+		return self.__column('marginal', self.__marginal)
+	# end getter 
+	
+#*************** end CmplSolElements ******************************
+
+#*************** CmplSolNameIndex  *********************************
+# name index for the variables or the constraints of a solution
+# - the base name of an indexed element (e.g. x for x[1,2]) refers to the positions of all its elements
+# - the name of an element without an index refers to its position
+class CmplSolNameIndex(object):
+
+	#*********** constructor **********
+	def __init__(self, elements):
+		self.__elements = elements
+		self.__count = len(elements)
+		self.__families = {}
+		self.__scalars = {}
+		self.__fullNames = None
+		
+		for i, n in enumerate(_solNames(elements)):
+			pos = n.find("[")
+			if pos != -1:
+				family = self.__families.get(n[:pos])
+				if family is None:
+					self.__families[n[:pos]] = [i]
+				else:
+					family.append(i)
+			else:
+				self.__scalars[n] = i
+	#*********** end constructor ******
+	
+	#*********** isValid **************
+	# false if elements were added after the index was built
+	def isValid(self, elements):
+		return elements is self.__elements and len(elements) == self.__count
+	#*********** end isValid **********
+	
+	#*********** find *****************
+	# returns the list of elements of an indexed variable or constraint, the element of
+	# a scalar variable or constraint or None if the name doesn't exist
+	def find(self, name):
+		family = self.__families.get(name)
+		if family is not None:
+			return [self.__elements[i] for i in family]
+		i = self.__scalars.get(name)
+		if i is not None:
+			return self.__elements[i]
+		return None
+	#*********** end find *************
+	
+	#*********** element **************
+	# returns the element with the full name (e.g. x[1,2]) or None
+	def element(self, fullName):
+		i = self.position(fullName)
+		if i is None:
+			return None
+		return self.__elements[i]
+	#*********** end element **********
+	
+	#*********** position *************
+	# returns the position of the element with the full name or None
+	def position(self, fullName):
+		return self.__fullNameMap().get(fullName)
+	
+	# returns the positions of the elements with the full names, -1 for names that don't exist
+	def positions(self, fullNames):
+		fullNameMap = self.__fullNameMap()
+		return [fullNameMap.get(n, -1) for n in fullNames]
+	
+	def __fullNameMap(self):
+		if self.__fullNames is None:
+			self.__fullNames = dict((n, i) for i, n in enumerate(_solNames(self.__elements)))
+		return self.__fullNames
+	#*********** end position *********
+	
+	#*********** families *************
+	# base names of the indexed elements with the positions of their elements
+	@property
+	def families(self):
+		return self.__families
+	
+	@property
+	def scalars(self):
+		return self.__scalars
+	#*********** end families *********
+	
+#*************** end CmplSolNameIndex ******************************
+
 #*************** CmplSolution  ***********************************
 class CmplSolution(object):
+	
+	__slots__ = ('__idx', '__status', '__value', '__variables', '__constraints', '__varIndex', '__conIndex', '__varLoader', '__conLoader')
 
 	#*********** constructor **********
-	def __init__(self):
+	def __init__(self, columnar=False):
 		self.__idx = 0
 		self.__status = ""
 		self.__value = 0
-		self.__variables = []
-		self.__constraints = []
+		if columnar:
+			self.__variables = CmplSolElements()
+			self.__constraints = CmplSolElements()
+		else:
+			self.__variables = []
+			self.__constraints = []
+		self.__varIndex = None
+		self.__conIndex = None
+		self.__varLoader = None
+		self.__conLoader = None
 	#*********** end constructor ******
 	
+	#*********** pickle ***************
+	# the name indexes and the loaders are not pickled, they are rebuilt or not needed after loading
+	def __getstate__(self):
+		self.variables
+		self.constraints
+		state = CmplTools.slotsState(self)
+		for name in ('__varIndex', '__conIndex', '__varLoader', '__conLoader'):
+			state.pop('_CmplSolution' + name, None)
+		return state
+	
+	def __setstate__(self, state):
+		self.__init__()
+		CmplTools.setSlotsState(self, state)
+	#*********** end pickle ***********
+	
 	# getter and setter 
 	@property
 	def idx(self):
@@ -136,28 +528,230 @@ class CmplSolution(object):
 	
 	@property
 	def variables(self):
+		if self.__varLoader is not None:
+			loader = self.__varLoader
+			self.__varLoader = None
+			loader(self.__variables)
 		return self.__variables
 		
 	def setVar(self, var):
-		self.__variables.append(var)
+		self.variables.append(var)
 		
 	@property
 	def constraints(self):
+		if self.__conLoader is not None:
+			loader = self.__conLoader
+			self.__conLoader = None
+			loader(self.__constraints)
 		return self.__constraints
 		
 	def setCon(self, con):
-		self.__constraints.append(con)
+		self.constraints.append(con)
+	
+	# the variables or constraints are read by the loaders when they are accessed the first time
+	def setLoaders(self, varLoader, conLoader):
+		self.__varLoader = varLoader
+		self.__conLoader = conLoader
+	
+	# name indexes, built on first use
+	@property
+	def varNameIndex(self):
+		variables = self.variables
+		if self.__varIndex is None or not self.__varIndex.isValid(variables):
+			self.__varIndex = CmplSolNameIndex(variables)
+		return self.__varIndex
+	
+	@property
+	def conNameIndex(self):
+		constraints = self.constraints
+		if self.__conIndex is None or not self.__conIndex.isValid(constraints):
+			self.__conIndex = CmplSolNameIndex(constraints)
+		return self.__conIndex
 		
 	# end getter and setter 	
 		
 #*************** end CmplSolution ********************************
 
 
+#*************** solution columns ********************************
+# names of variables or constraints
+def _solNames(elements):
+	if isinstance(elements, CmplSolElements):
+		return elements.names
+	return [e.name for e in elements]
+
+# positions of the activities, bounds and marginals in the raw columns of CmplSolElements
+CMPL_SOLUTION_VALUES = { 'activity' : 4, 'lowerBound' : 5, 'upperBound' : 6, 'marginal' : 7 }
+
+# activities, marginals, lower or upper bounds of variables or constraints as array
+def _solValues(elements, value):
+	if isinstance(elements, CmplSolElements):
+		return elements.rawColumns()[CMPL_SOLUTION_VALUES[value]]
+	return array('d', map(attrgetter(value), elements))
+
+# true if two values differ by more than the tolerance, equal infinite values and NaN values don't differ
+def _solValueChanged(x, y, tol):
+	return not (x == y or abs(x - y) <= tol or (x != x and y != y))
+#*************** end solution columns ****************************
+
+
+#*************** CmplSolDiff *************************************
+# differences between the variables or the constraints of two solutions that are aligned by name
+# - names: names of the elements in both solutions whose activity or marginal differ by more than the tolerance
+# - positions, otherPositions: positions of these elements in both solutions
+# - activity, otherActivity, marginal, otherMarginal: values of these elements in both solutions
+# - activityChanged, marginalChanged: which of the values differ
+# - onlyInSolution, onlyInOther: names of the elements that exist only in one of the solutions
+# the positions, values and flags are numpy arrays (or arrays and lists if numpy is not available)
+class CmplSolDiff(object):
+
+	#*********** constructor **********
+	def __init__(self, solution, other, isVar=True, tol=1e-9):
+		if isVar:
+			elements, otherElements, otherIndex = solution.variables, other.variables, other.varNameIndex
+		else:
+			elements, otherElements, otherIndex = solution.constraints, other.constraints, other.conNameIndex
+		
+		names = _solNames(elements)
+		otherNames = _solNames(otherElements)
+		
+		# the elements are aligned by the name index of the other solution if the names differ
+		if names == otherNames:
+			positions = range(len(names))
+			otherPositions = positions
+			self.__onlyInSolution = []
+			self.__onlyInOther = []
+		else:
+			allPositions = otherIndex.positions(names)
+			positions = [i for i, p in enumerate(allPositions) if p != -1]
+			otherPositions = [p for p in allPositions if p != -1]
+			nameSet = set(names)
+			self.__onlyInSolution = [n for n, p in zip(names, allPositions) if p == -1]
+			self.__onlyInOther = [n for n in otherNames if not n in nameSet]
+		
+		activity, otherActivity = _solValues(elements, 'activity'), _solValues(otherElements, 'activity')
+		marginal, otherMarginal = _solValues(elements, 'marginal'), _solValues(otherElements, 'marginal')
+		
+		if np is not None:
+			positions = np.asarray(positions, dtype=np.int64)
+			otherPositions = np.asarray(otherPositions, dtype=np.int64)
+			columns = []
+			for col, otherCol in ((activity, otherActivity), (marginal, otherMarginal)):
+				x = np.frombuffer(col, dtype=np.float64)[positions]
+				y = np.frombuffer(otherCol, dtype=np.float64)[otherPositions]
+				with np.errstate(invalid='ignore'):
+					changed = ~((x == y) | (np.abs(x - y) <= tol) | (np.isnan(x) & np.isnan(y)))
+				columns.append((x, y, changed))
+			sel = np.flatnonzero(columns[0][2] | columns[1][2])
+			self.__positions = positions[sel]
+			self.__otherPositions = otherPositions[sel]
+			self.__names = [names[i] for i in self.__positions.tolist()]
+			self.__activity, self.__otherActivity, self.__activityChanged = [c[sel] for c in columns[0]]
+			self.__marginal, self.__otherMarginal, self.__marginalChanged = [c[sel] for c in columns[1]]
+		else:
+			sel = [k for k, (i, j) in enumerate(zip(positions, otherPositions))
+				   if _solValueChanged(activity[i], otherActivity[j], tol) or _solValueChanged(marginal[i], otherMarginal[j], tol)]
+			self.__positions = array('q', [positions[k] for k in sel])
+			self.__otherPositions = array('q', [otherPositions[k] for k in sel])
+			self.__names = [names[i] for i in self.__positions]
+			self.__activity = array('d', [activity[i] for i in self.__positions])
+			self.__otherActivity = array('d', [otherActivity[j] for j in self.__otherPositions])
+			self.__marginal = array('d', [marginal[i] for i in self.__positions])
+			self.__otherMarginal = array('d', [otherMarginal[j] for j in self.__otherPositions])
+			self.__activityChanged = [_solValueChanged(x, y, tol) for x, y in zip(self.__activity, self.__otherActivity)]
+			self.__marginalChanged = [_solValueChanged(x, y, tol) for x, y in zip(self.__marginal, self.__otherMarginal)]
+	#*********** end constructor ******
+	
+	def __len__(self):
+		return len(self.__names)
+	
+	# getter 
+	@property
+	def names(self):
+		return self.__names
+	
+	@property
+	def positions(self):
+		return self.__positions
+	
+	@property
+	def otherPositions(self):
+		return self.__otherPositions
+	
+	@property
+	def activity(self):
+		return self.__activity
+	
+	@property
+	def otherActivity(self):
+		return self.__otherActivity
+	
+	@property
+	def activityChanged(self):
+		return self.__activityChanged
+	
+	@property
+	def marginal(self):
+		return self.__marginal
+	
+	@property
+	def otherMarginal(self):
+		return self.__otherMarginal
+	
+	@property
+	def marginalChanged(self):
+		return self.__marginalChanged
+	
+	@property
+	def onlyInSolution(self):
+		return self.__onlyInSolution
+	
+	@property
+	def onlyInOther(self):
+		return self.__onlyInOther
+	# end getter 
+	
+#*************** end CmplSolDiff *********************************
+
+
+#*********** solBlockColumns *************
+# parses a block of complete lines of a solution file and returns the attribute values of the
+# elements that pass the filter as columns (idx, name, type, activity, lowerBound, upperBound, marginal)
+# - a module level function that can be used by the worker processes of CmplSolutions
+# - compact columns (arrays) are returned to the workers, otherwise the numeric columns are iterators
+def _solBlockColumns(block, isVar, nameFilter=None, nonZerosOnly=False, compact=False):
+	pattern = CMPL_SOLUTION_VAR_PATTERN if isVar else CMPL_SOLUTION_CON_PATTERN
+	rows = pattern.findall(block.decode("utf-8"))
+	
+	# the rows are filtered before any value is converted
+	if nameFilter is not None:
+		match = nameFilter.match
+		rows = [r for r in rows if match(r[1]) or match(r[1].split('[', 1)[0])]
+	if nonZerosOnly:
+		rows = [r for r in rows if float(r[3]) != 0]
+	if not rows:
+		return None
+	
+	idx, names, types, activities, lowerBounds, upperBounds, marginals = zip(*rows)
+	
+	if '-' in marginals:
+		marginals = [float('NaN') if m=='-' else float(m) for m in marginals]
+	else:
+		marginals = map(float, marginals)
+	
+	columns = (map(int, idx), names, types, map(float, activities), map(float, lowerBounds), map(float, upperBounds), marginals)
+	if compact:
+		idx, names, types, activities, lowerBounds, upperBounds, marginals = columns
+		columns = (array('q', idx), names, types, array('d', activities), array('d', lowerBounds), array('d', upperBounds), array('d', marginals))
+	return columns
+#*********** end solBlockColumns *********
+
+
 #*************** CmplSolutions  **********************************
 class CmplSolutions(object):
 
 	#*********** constructor **********
-	def __init__(self, solFile=None):
+	def __init__(self, solFile=None, columnar=False):
 		self.__nrOfVariables = 0
 		self.__nrOfConstraints = 0
 		self.__objectiveName = ""
@@ -172,10 +766,55 @@ class CmplSolutions(object):
 		self.__cmplSolFile = ""
 		self.__solList = []
 		self.__solutionFile = solFile
-		self.__solFileContent = ""
+		self.__solData = b""
+		self.__solTmpFile = None
 		self.__isIntegerProgram = False
+		self.__columnar = columnar
+		self.__varFilter = None
+		self.__conFilter = None
+		self.__nonZerosOnly = False
+		self.__workers = 1
+		self.__binaryCache = False
+		self.__solDataPending = False
 	#*********** end constructor ******
 	
+	#*********** setFilter ************
+	# restricts the elements that are read to those whose name or base name (e.g. x for x[1,2])
+	# match one of the patterns (fnmatch syntax) and optionally to those with a nonzero activity
+	# - None means all elements, an empty list no element
+	def setFilter(self, varPatterns=None, conPatterns=None, nonZerosOnly=False):
+		self.__varFilter = self.namePattern(varPatterns)
+		self.__conFilter = self.namePattern(conPatterns)
+		self.__nonZerosOnly = nonZerosOnly
+	
+	# regular expression for a list of name patterns, None if no pattern is given
+	@staticmethod
+	def namePattern(patterns):
+		if patterns is None:
+			return None
+		if type(patterns) == str:
+			patterns = [patterns]
+		if len(patterns) == 0:
+			return re.compile("(?!)")
+		return re.compile("|".join([fnmatch.translate(p) for p in patterns]))
+	#*********** end setFilter ********
+	
+	#*********** setWorkers ***********
+	# number of worker processes that parse the elements of solution files above CMPL_SOLUTION_PARALLEL_SIZE
+	def setWorkers(self, workers):
+		self.__workers = workers
+	#*********** end setWorkers *******
+	
+	#*********** setBinaryCache *******
+	# a binary snapshot of the solutions is kept next to the solution file (sidecar cache) and is read
+	# instead of the solution file as long as its size, modification time and hash are unchanged
+	# - only used if no filter is set
+	# - only useful if CmplSolutions reads a persistent solution file several times, the solution
+	#   files of Cmpl are written anew by every solve and removed afterwards
+	def setBinaryCache(self, ok=True):
+		self.__binaryCache = ok
+	#*********** end setBinaryCache ***
+	
 	# getter
 	@property
 	def nrOfVariables(self):
@@ -239,10 +878,74 @@ class CmplSolutions(object):
 		
 	@property
 	def solFileContent(self):
-		return self.__solFileContent
+		return self.__currentSolData()[:].decode("utf-8")
+	
+	def __currentSolData(self):
+		if self.__solDataPending:
+			# the solutions were taken from the binary cache
+			self.__solDataPending = False
+			if os.path.isfile(self.__solutionFile):
+				self.__mapSolution(None)
+		return self.__solData
+	
+	#*********** writeSolFile ************
+	# copies the content of the solution file block-wise to a file, only the instance name in the
+	# general section is replaced if an instance name is given
+	# - if the file is the solution file itself, the content is written to a temporary file in the
+	#   same directory that replaces the solution file afterwards, so the file that is read is never truncated
+	def writeSolFile(self, fileName, instanceName=None):
+		content = self.__currentSolData()
+		if len(content) == 0:
+			raise CmplException("No content of the cmplSolution file available")
+		
+		isSolFile = False
+		try:
+			isSolFile = self.__solutionFile is not None and os.path.samefile(fileName, self.__solutionFile)
+		except (IOError, OSError):
+			pass
+		
+		pos = 0
+		tmpName = None
+		try:
+			if isSolFile:
+				fd, tmpName = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(fileName)))
+				f = os.fdopen(fd, "wb")
+			else:
+				f = open(fileName, "wb")
+			
+			with f:
+				if instanceName is not None:
+					headerEnd = content.find(b"<solution")
+					if headerEnd == -1:
+						headerEnd = len(content)
+					pos1 = content.find(b"<instanceName>", 0, headerEnd)
+					pos2 = content.find(b"</instanceName>", 0, headerEnd)
+					if pos1 != -1 and pos2 > pos1:
+						f.write(content[:pos1 + len(b"<instanceName>")])
+						f.write(instanceName.encode("utf-8"))
+						pos = pos2
+				
+				while pos < len(content):
+					f.write(content[pos:pos + CMPL_SOLUTION_CHUNK_SIZE])
+					pos += CMPL_SOLUTION_CHUNK_SIZE
+			
+			if tmpName is not None:
+				shutil.copymode(fileName, tmpName)
+				os.replace(tmpName, fileName)
+				tmpName = None
+		except (IOError, OSError) as e:
+			raise CmplException("IO error for file " + fileName + ": " + str(e.strerror))
+		finally:
+			if tmpName is not None and os.path.isfile(tmpName):
+				os.remove(tmpName)
+	#*********** end writeSolFile ********
 	
 	def delSolFileContent(self):
-		self.__solFileContent=""
+		for s in self.__solList:
+			s.variables
+			s.constraints
+		self.__solDataPending = False
+		self.__releaseSolData()
 	
 	@property
 	def isIntegerProgram(self):
@@ -278,7 +981,469 @@ class CmplSolutions(object):
 	#*********** end readSolLine *********	
 	
 	
+	#*********** addSolColumns **********
+	# adds the elements given by the columns of a parsed block of lines to a solution
+	def __addSolColumns(self, elements, columns, isVar):
+		idx, names, types, activities, lowerBounds, upperBounds, marginals = columns
+		
+		if isinstance(elements, CmplSolElements):
+			if elements.isShared:
+				return elements.extendValues(idx, names, types, activities, lowerBounds, upperBounds, marginals)
+			elements.extendColumns(idx, names, types, activities, lowerBounds, upperBounds, marginals)
+		else:
+			if isVar and ('I' in types or 'B' in types):
+				activities = [int(a) if t=='I' or t=='B' else a for t, a in zip(types, activities)]
+			elements.extend(map(CmplSolElement, idx, names, types, activities, lowerBounds, upperBounds, marginals))
+	#*********** end addSolColumns ******
+	
+	#*********** solBlocks **************
+	# splits the byte range start:end of the solution file content into blocks of complete lines
+	def __solBlocks(self, start, end):
+		content = self.__solData
+		pos = start
+		while pos < end:
+			blockEnd = content.rfind(b"\n", pos, min(pos + CMPL_SOLUTION_CHUNK_SIZE, end)) + 1
+			if blockEnd <= pos or pos + CMPL_SOLUTION_CHUNK_SIZE >= end:
+				blockEnd = end
+			yield pos, blockEnd
+			pos = blockEnd
+	#*********** end solBlocks **********
+	
+	#*********** parallelSolColumns *****
+	# parses the blocks in worker processes, the columns are returned in the order of the blocks
+	# - only a limited number of blocks is passed to the workers at the same time
+	def __parallelSolColumns(self, start, end, isVar, nameFilter):
+		content = self.__solData
+		with concurrent.futures.ProcessPoolExecutor(max_workers=self.__workers) as pool:
+			pending = collections.deque()
+			for pos, blockEnd in self.__solBlocks(start, end):
+				pending.append(pool.submit(_solBlockColumns, content[pos:blockEnd], isVar, nameFilter, self.__nonZerosOnly, True))
+				if len(pending) >= 2 * self.__workers:
+					yield pending.popleft().result()
+			while pending:
+				yield pending.popleft().result()
+	#*********** end parallelSolColumns *
+	
+	#*********** loadSolElements ********
+	# reads the variables or the constraints of a solution from the byte range start:end of the
+	# solution file content in blocks of complete lines
+	# - the blocks of solution files above CMPL_SOLUTION_PARALLEL_SIZE are parsed by several worker processes
+	#   if more than one worker is set
+	def __loadSolElements(self, start, end, isVar, elements):
+		content = self.__solData
+		nameFilter = self.__varFilter if isVar else self.__conFilter
+		
+		if self.__workers > 1 and len(content) >= CMPL_SOLUTION_PARALLEL_SIZE:
+			blockColumns = self.__parallelSolColumns(start, end, isVar, nameFilter)
+		else:
+			blockColumns = (_solBlockColumns(content[pos:blockEnd], isVar, nameFilter, self.__nonZerosOnly) for pos, blockEnd in self.__solBlocks(start, end))
+		
+		# the garbage collector would be triggered again and again by the creation of the elements
+		gcEnabled = gc.isenabled()
+		gc.disable()
+		try:
+			for columns in blockColumns:
+				if columns is not None and self.__addSolColumns(elements, columns, isVar) == False:
+					blockColumns.close()
+					return False
+		except ValueError as e:
+			raise CmplException("Cant't read cmplSolution file " + str(self.__solutionFile) + " - wrong file format: " + str(e))
+		finally:
+			if gcEnabled:
+				gc.enable()
+	#*********** end loadSolElements ****
+	
+	#*********** solLoader ***************
+	def __solLoader(self, start, end, isVar):
+		return lambda elements: self.__loadSolElements(start, end, isVar, elements)
+	
+	# loader for an entry of a solution pool that shares the invariant columns with the first solution
+	# - if the elements don't match those of the first solution they are read completely
+	def __poolLoader(self, first, start, end, isVar):
+		def loader(elements):
+			elements.shareColumns(first.variables if isVar else first.constraints)
+			if self.__loadSolElements(start, end, isVar, elements) == False or not elements.isComplete:
+				elements.clear()
+				self.__loadSolElements(start, end, isVar, elements)
+		return loader
+	#*********** end solLoader ***********
+	
+	#*********** readSolHeaders **********
+	# reads the general section and the headers of the solutions, the positions of the
+	# variables and constraints sections are kept for reading them on demand
+	def __readSolHeaders(self, content):
+		headers = []
+		header = None
+		
+		for m in CMPL_SOLUTION_SOL_PATTERN.finditer(content):
+			if m.group(1) is None:
+				if header is not None:
+					solStart, solEnd = header[3], m.start()
+					varStart = content.find(b"<variables>", solStart, solEnd)
+					varEnd = content.find(b"</variables>", solStart, solEnd)
+					conStart = content.find(b"<linearConstraints>", solStart, solEnd)
+					conEnd = content.find(b"</linearConstraints>", solStart, solEnd)
+					
+					if varStart == -1 or varEnd == -1:
+						varStart, varEnd = solStart, solEnd
+					if conStart == -1 or conEnd == -1:
+						conStart, conEnd = solStart, solEnd
+					
+					if content.find(b'type="I"', varStart, varEnd) != -1 or content.find(b'type="B"', varStart, varEnd) != -1:
+						self.__isIntegerProgram=True
+					
+					headers.append(header[:3] + (varStart, varEnd, conStart, conEnd))
+				header = None
+			else:
+				header = (int(m.group(1)), m.group(2).decode("utf-8"), float(m.group(3)), m.end())
+		
+		headerEnd = content.find(b"<solution")
+		if headerEnd == -1:
+			headerEnd = len(content)
+		for name, val in CMPL_SOLUTION_GENERAL_PATTERN.findall(content, 0, headerEnd):
+			name = name.decode("utf-8")
+			if name in CMPL_SOLUTION_GENERAL:
+				setattr(self, '_CmplSolutions' + CMPL_SOLUTION_GENERAL[name][1], CMPL_SOLUTION_GENERAL[name][0](val.decode("utf-8")))
+		
+		# the entries of a solution pool in columnar mode share the invariant columns,
+		# unless the elements of the entries may differ because only nonzero elements are read
+		isPool = self.__columnar and len(headers) > 1 and not self.__nonZerosOnly
+		
+		first = None
+		for idx, status, value, varStart, varEnd, conStart, conEnd in headers:
+			s = CmplSolution(self.__columnar)
+			s.setIdx(idx)
+			s.setStatus(status)
+			s.setValue(value)
+			if first is None or not isPool:
+				s.setLoaders(self.__solLoader(varStart, varEnd, True), self.__solLoader(conStart, conEnd, False))
+				first = s
+			else:
+				s.setLoaders(self.__poolLoader(first, varStart, varEnd, True), self.__poolLoader(first, conStart, conEnd, False))
+			self.__solList.append(s)
+	#*********** end readSolHeaders ******
+	
+	#*********** mapSolution *************
+	# the solution is copied into an anonymous temporary file that is mapped into memory,
+	# so the raw text is not held as a string and the mapping is neither invalidated if the 
+	# solution file is removed nor if it is rewritten (e.g. by saveSolution or the next solve)
+	def __mapSolution(self, solStr):
+		self.__releaseSolData()
+		
+		tmpFile = tempfile.TemporaryFile()
+		try:
+			if solStr is None:
+				with open(self.__solutionFile, "rb") as f:
+					shutil.copyfileobj(f, tmpFile, CMPL_SOLUTION_CHUNK_SIZE)
+			elif type(solStr) == str:
+				for i in range(0, len(solStr), CMPL_SOLUTION_CHUNK_SIZE):
+					tmpFile.write(solStr[i:i+CMPL_SOLUTION_CHUNK_SIZE].encode("utf-8"))
+			else:
+				tmpFile.write(solStr)
+			tmpFile.flush()
+			
+			if tmpFile.tell() > 0:
+				self.__solData = mmap.mmap(tmpFile.fileno(), 0, access=mmap.ACCESS_READ)
+				self.__solTmpFile = tmpFile
+			else:
+				tmpFile.close()
+		except (IOError, OSError, ValueError) as e:
+			tmpFile.close()
+			raise CmplException("IO error for solution file ")
+	#*********** end mapSolution *********
+	
+	#*********** releaseSolData **********
+	def __releaseSolData(self):
+		if type(self.__solData) == mmap.mmap:
+			self.__solData.close()
+		if self.__solTmpFile is not None:
+			self.__solTmpFile.close()
+		self.__solData = b""
+		self.__solTmpFile = None
+	#*********** end releaseSolData ******
+	
+	#*********** pickle ******************
+	# the pending variables and constraints are read before pickling, the raw text
+	# is pickled as string like in former versions
+	def __getstate__(self):
+		for s in self.__solList:
+			s.variables
+			s.constraints
+		state = self.__dict__.copy()
+		del state['_CmplSolutions__solData']
+		del state['_CmplSolutions__solTmpFile']
+		state['_CmplSolutions__solFileContent'] = self.solFileContent
+		return state
+	
+	def __setstate__(self, state):
+		self.__init__()
+		state = state.copy()
+		solFileContent = state.pop('_CmplSolutions__solFileContent', "")
+		self.__dict__.update(state)
+		self.__solData = solFileContent.encode("utf-8")
+	#*********** end pickle **************
+	
+	#*********** diff ********************
+	# differences between the solution solNr and the solution otherSolNr of other (CmplSolutions)
+	# or the solution other (CmplSolution) as CmplSolDiff of the variables and of the constraints
+	def diff(self, other, tol=1e-9, solNr=0, otherSolNr=0):
+		if isinstance(other, CmplSolutions):
+			if otherSolNr < 0 or otherSolNr >= len(other.solutions):
+				raise CmplException("Solution with index " + str(otherSolNr) + " doesn't exist.")
+			other = other.solutions[otherSolNr]
+		if solNr < 0 or solNr >= len(self.__solList):
+			raise CmplException("Solution with index " + str(solNr) + " doesn't exist.")
+		
+		solution = self.__solList[solNr]
+		return CmplSolDiff(solution, other, True, tol), CmplSolDiff(solution, other, False, tol)
+	#*********** end diff ****************
+	
+	#*********** solutionMatrix **********
+	# values (activity, lowerBound, upperBound or marginal) of the variables or the constraints of several
+	# solutions as matrix with one row per element of the first solution and one column per solution
+	# - solutions: CmplSolution or CmplSolutions objects (their first solution), by default the solution pool
+	# - the elements of the other solutions are aligned by name, missing elements are NaN
+	# - returns the names of the rows and the matrix as numpy array (as list of column arrays if numpy is not available)
+	def solutionMatrix(self, solutions=None, elements="variables", value="activity"):
+		if not elements in ("variables", "constraints"):
+			raise CmplException("unknown solution elements: " + str(elements))
+		if not value in CMPL_SOLUTION_VALUES:
+			raise CmplException("unknown solution value: " + str(value))
+		
+		if solutions is None:
+			solutions = self.__solList
+		solutions = [s.solution if isinstance(s, CmplSolutions) else s for s in solutions]
+		isVar = elements == "variables"
+		
+		names = []
+		columns = []
+		for j, s in enumerate(solutions):
+			solElements = s.variables if isVar else s.constraints
+			solNames = _solNames(solElements)
+			if j == 0:
+				names = solNames
+			
+			positions = None
+			if not (solNames is names or solNames == names):
+				positions = (s.varNameIndex if isVar else s.conNameIndex).positions(names)
+			columns.append((_solValues(solElements, value), positions))
+		
+		if np is not None:
+			matrix = np.empty((len(names), len(columns)))
+			for j, (col, positions) in enumerate(columns):
+				col = np.frombuffer(col, dtype=np.float64)
+				if positions is None:
+					matrix[:, j] = col
+				else:
+					positions = np.asarray(positions, dtype=np.int64)
+					matrix[:, j] = col[np.maximum(positions, 0)] if len(col) > 0 else np.nan
+					matrix[positions < 0, j] = np.nan
+			return names, matrix
+		
+		matrix = []
+		for col, positions in columns:
+			if positions is not None:
+				col = array('d', [col[p] if p != -1 else float('NaN') for p in positions])
+			matrix.append(col)
+		return names, matrix
+	#*********** end solutionMatrix ******
+	
+	#*********** binary snapshots *******
+	# binary snapshot of the solutions:
+	# - magic bytes, length of the header (8 bytes, little endian), header as JSON
+	# - per solution the columns of the variables and the constraints as raw arrays:
+	#   idx, name offsets, name table (utf-8), type codes, lowerBound, upperBound, activity, marginal
+	# - the entries of a solution pool that share their invariant columns with the first solution
+	#   contain only activity and marginal
+	# - the solutions are read into columnar stores (CmplSolElements)
+	def saveBinary(self, fileName):
+		self.__writeBinary(fileName, None)
+	
+	def readBinary(self, fileName):
+		try:
+			with open(fileName, "rb") as f:
+				header = self.__readBinaryHeader(f, fileName)
+				self.__readBinaryData(f, header, fileName)
+		except (IOError, OSError) as e:
+			raise CmplException("IO error for binary solution file " + fileName + ": " + str(e))
+	
+	def __writeBinary(self, fileName, key):
+		header = { 'version' : CMPL_SOLUTION_BINARY_VERSION, 'byteOrder' : sys.byteorder, 'key' : key,
+				   'isIntegerProgram' : self.__isIntegerProgram, 'solutions' : [],
+				   'general' : dict((name, getattr(self, '_CmplSolutions' + attr)) for name, (t, attr) in CMPL_SOLUTION_GENERAL.items()) }
+		blocks = []
+		for s in self.__solList:
+			header['solutions'].append({ 'idx' : s.idx, 'status' : s.status, 'value' : s.value,
+										 'variables' : self.__binaryBlocks(s.variables, blocks),
+										 'constraints' : self.__binaryBlocks(s.constraints, blocks) })
+		
+		headerBytes = json.dumps(header).encode("utf-8")
+		try:
+			with open(fileName, "wb") as f:
+				f.write(CMPL_SOLUTION_BINARY_MAGIC)
+				f.write(struct.pack("<Q", len(headerBytes)))
+				f.write(headerBytes)
+				for b in blocks:
+					f.write(b)
+		except (IOError, OSError) as e:
+			raise CmplException("IO error for binary solution file " + fileName + ": " + str(e))
+	
+	# appends the columns of the variables or constraints of a solution to the blocks to be written
+	@staticmethod
+	def __binaryBlocks(elements, blocks):
+		if isinstance(elements, CmplSolElements):
+			idx, names, typeCodes, typeTable, activity, lowerBound, upperBound, marginal = elements.rawColumns()
+			isShared = elements.isShared
+		else:
+			typeMap = {}
+			idx = array('q', [e.idx for e in elements])
+			names = [e.name for e in elements]
+			typeCodes = array('B', [typeMap.setdefault(e.type, len(typeMap)) for e in elements])
+			typeTable = list(typeMap)
+			activity = array('d', [e.activity for e in elements])
+			lowerBound = array('d', [e.lowerBound for e in elements])
+			upperBound = array('d', [e.upperBound for e in elements])
+			marginal = array('d', [e.marginal for e in elements])
+			isShared = False
+		
+		info = { 'count' : len(activity), 'shared' : isShared }
+		if not isShared:
+			nameTable = [n.encode("utf-8") for n in names]
+			offsets = array('q', [0])
+			offsets.extend(itertools.accumulate(map(len, nameTable)))
+			info['typeTable'] = typeTable
+			info['nameTableSize'] = offsets[-1]
+			blocks.extend((idx, offsets, b"".join(nameTable), typeCodes, lowerBound, upperBound))
+		blocks.extend((activity, marginal))
+		return info
+	
+	def __readBinaryHeader(self, f, fileName):
+		try:
+			if f.read(len(CMPL_SOLUTION_BINARY_MAGIC)) != CMPL_SOLUTION_BINARY_MAGIC:
+				raise ValueError("wrong file type")
+			headerSize = struct.unpack("<Q", f.read(8))[0]
+			header = json.loads(f.read(headerSize).decode("utf-8"))
+		except (ValueError, struct.error) as e:
+			raise CmplException("File " + fileName + " - is not a binary cmplSolution file: " + str(e))
+		if header.get('version') != CMPL_SOLUTION_BINARY_VERSION:
+			raise CmplException("File " + fileName + " - unsupported version of the binary cmplSolution file")
+		return header
+	
+	def __readBinaryData(self, f, header, fileName):
+		buf = memoryview(f.read())
+		swap = header['byteOrder'] != sys.byteorder
+		pos = 0
+		
+		def column(typecode, n):
+			nonlocal pos
+			col = array(typecode)
+			size = n * col.itemsize
+			if pos + size > len(buf):
+				raise CmplException("File " + fileName + " - binary cmplSolution file is truncated")
+			col.frombytes(buf[pos:pos+size])
+			if swap:
+				col.byteswap()
+			pos += size
+			return col
+		
+		solList = []
+		for sol in header['solutions']:
+			s = CmplSolution(True)
+			s.setIdx(sol['idx'])
+			s.setStatus(sol['status'])
+			s.setValue(sol['value'])
+			
+			for family, elements in (('variables', s.variables), ('constraints', s.constraints)):
+				info = sol[family]
+				n = info['count']
+				if info['shared']:
+					elements.shareColumns(solList[0].variables if family == 'variables' else solList[0].constraints)
+					elements.setValueColumns(column('d', n), column('d', n))
+					continue
+				
+				idx = column('q', n)
+				offsets = column('q', n + 1)
+				nameTable = column('B', info['nameTableSize']).tobytes()
+				text = nameTable.decode("utf-8")
+				if len(text) == len(nameTable):
+					names = [sys.intern(text[a:b]) for a, b in zip(offsets, offsets[1:])]
+				else:
+					names = [sys.intern(nameTable[a:b].decode("utf-8")) for a, b in zip(offsets, offsets[1:])]
+				typeCodes = column('B', n)
+				lowerBound = column('d', n)
+				upperBound = column('d', n)
+				elements.setRawColumns(idx, names, typeCodes, info['typeTable'], column('d', n), lowerBound, upperBound, column('d', n))
+			solList.append(s)
+		
+		# without columnar mode the variables and constraints are lists like those read from the solution file
+		if not self.__columnar:
+			for i, s in enumerate(solList):
+				solList[i] = CmplSolution()
+				solList[i].setIdx(s.idx)
+				solList[i].setStatus(s.status)
+				solList[i].setValue(s.value)
+				solList[i].variables.extend(s.variables)
+				solList[i].constraints.extend(s.constraints)
+		
+		for name, val in header['general'].items():
+			if name in CMPL_SOLUTION_GENERAL:
+				setattr(self, '_CmplSolutions' + CMPL_SOLUTION_GENERAL[name][1], val)
+		self.__isIntegerProgram = header['isIntegerProgram']
+		self.__solList = solList
+	#*********** end binary snapshots ***
+	
+	#*********** binary cache ************
+	def __useBinaryCache(self):
+		return self.__binaryCache and self.__solutionFile is not None and self.__varFilter is None and self.__conFilter is None and not self.__nonZerosOnly
+	
+	def __cacheKey(self, content=None):
+		st = os.stat(self.__solutionFile)
+		key = { 'size' : st.st_size, 'mtime' : st.st_mtime_ns, 'hash' : None }
+		h = hashlib.blake2b(digest_size=16)
+		if content is not None:
+			h.update(content)
+		else:
+			with open(self.__solutionFile, "rb") as f:
+				for block in iter(lambda: f.read(CMPL_SOLUTION_CHUNK_SIZE), b""):
+					h.update(block)
+		key['hash'] = h.hexdigest()
+		return key
+	
+	# reads the solutions from the sidecar cache if it belongs to the unchanged solution file
+	def __readBinaryCache(self):
+		cacheFile = self.__solutionFile + CMPL_SOLUTION_CACHE_SUFFIX
+		if not os.path.isfile(cacheFile):
+			return False
+		try:
+			with open(cacheFile, "rb") as f:
+				header = self.__readBinaryHeader(f, cacheFile)
+				key = header.get('key')
+				st = os.stat(self.__solutionFile)
+				if key is None or key['size'] != st.st_size or key['mtime'] != st.st_mtime_ns:
+					return False
+				if key['hash'] != self.__cacheKey()['hash']:
+					return False
+				self.__readBinaryData(f, header, cacheFile)
+		except (CmplException, IOError, OSError, KeyError, TypeError):
+			return False
+		
+		self.__releaseSolData()
+		self.__solDataPending = True
+		return True
+	
+	# a cache that can't be written is ignored
+	def __writeBinaryCache(self):
+		cacheFile = self.__solutionFile + CMPL_SOLUTION_CACHE_SUFFIX
+		try:
+			self.__writeBinary(cacheFile + ".tmp", self.__cacheKey(self.__solData))
+			os.replace(cacheFile + ".tmp", cacheFile)
+		except (CmplException, IOError, OSError):
+			pass
+	#*********** end binary cache ********
+	
 	#*********** readSolution ************	
+	# only the general section and the headers of the solutions are parsed immediately,
+	# the variables and constraints of a solution are read when they are accessed the first time
 	def readSolution(self, solStr=None):
 		
 		if (solStr == None or len(solStr)==0) and self.__solutionFile == None:
@@ -287,113 +1452,27 @@ class CmplSolutions(object):
 		if self.__solutionFile != None:
 			if not os.path.isfile(self.__solutionFile):
 				raise CmplException("No solution found" )
-				
-			try:	
-				f = open(self.__solutionFile, "r")
-				solStr = f.read()
-				f.close()
-			except IOError as e:
-				raise CmplException("IO error for solution file ")
-		
-		lines = io.StringIO(solStr) 
-		
-		lineNr=1
-		generalSection=False
-		solutionSection=False
-		varSection=False
-		conSection=False
-		s = CmplSolution()
-		self.__solFileContent=solStr
-		
-		for line in lines:
-			
-			if lineNr == 1:
-				if not "<?xml version" in line: 
-					raise CmplException("File " + self.__solutionFile + " - is not a XML file!")
-				else:
-					lineNr += 1
-					continue
-			if lineNr == 2:
-				if not "<CmplSolutions" in line: 
-					raise CmplException("Cant't read cmplSolution file " + self.__solutionFile + " - wrong file type!")
-				else:
-					lineNr += 1
-					continue
-			
-			if "<general>" in line:
-				generalSection=True
-				solutionSection=False
-				continue
-			if "</general>" in line:
-				generalSection=False
-				continue
-				
-			if "<solution" in line:
-				generalSection=False
-				solutionSection=True
-				s = CmplSolution()
-				tmpList = re.findall("\"([^\"]*)\"", line)
-				s.setIdx(int(tmpList[0]))
-				s.setStatus(tmpList[1])
-				s.setValue(float(tmpList[2]))
-				continue
-			if "</solution" in line:
-				solutionSection=False
-				self.__solList.append(s)
-				continue
-				
-			if generalSection:
-				if "<nrOfVariables" in line:
-					self.__nrOfVariables = int(re.findall("<nrOfVariables>([^\"]*)</nrOfVariables>", line)[0])
-					continue
-				if "<nrOfConstraints" in line:
-					self.__nrOfConstraints = int(re.findall("<nrOfConstraints>([^\"]*)</nrOfConstraints>", line)[0])
-					continue
-				if "<objectiveName" in line:
-					self.__objectiveName = re.findall("<objectiveName>([^\"]*)</objectiveName>", line)[0]
-					continue
-				if "<objectiveSense" in line:
-					self.__objectiveSense = re.findall("<objectiveSense>([^\"]*)</objectiveSense>", line)[0]
-					continue
-				if "<nrOfSolutions" in line:
-					self.__nrOfSolutions = int(re.findall("<nrOfSolutions>([^\"]*)</nrOfSolutions>", line)[0])
-					continue
-				if "<solverName" in line:
-					self.__solverName = re.findall("<solverName>([^\"]*)</solverName>", line)[0]
-					continue
-				if "<solverMsg" in line:
-					self.__solverMsg = re.findall("<solverMsg>([^\"]*)</solverMsg>", line)[0]
-					continue
-				if "<variablesDisplayOptions" in line:
-					self.__varDisplayOptions = re.findall("<variablesDisplayOptions>([^\"]*)</variablesDisplayOptions>", line)[0]
-					continue
-				if "<constraintsDisplayOptions" in line:
-					self.__conDisplayOptions = re.findall("<constraintsDisplayOptions>([^\"]*)</constraintsDisplayOptions>", line)[0]
-					continue
-			
-			if solutionSection:
-				if "<variables>" in line:
-					varSection=True
-					conSection=False
-					continue
-				if "</variables>" in line:
-					varSection=False
-					continue
-				if "<linearConstraints>" in line:
-					varSection=False
-					conSection=True
-					continue
-				if "</linearConstraints>" in line:
-					conSection=False
-					continue
-				if varSection:
-					if "<variable" in line:
-						s.setVar(self._readSolLine(line))
-						continue
-				if conSection:
-					if "<constraint" in line:
-						s.setCon(self._readSolLine(line))
-						continue
+			if self.__useBinaryCache() and self.__readBinaryCache():
+				return
+			self.__mapSolution(None)
+		else:
+			self.__mapSolution(solStr)
+		
+		fileName = str(self.__solutionFile)
+		
+		lines = self.__solData[:4096].split(b"\n", 2)
+		if not b"<?xml version" in lines[0]: 
+			raise CmplException("File " + fileName + " - is not a XML file!")
+		if len(lines) < 2 or not b"<CmplSolutions" in lines[1]: 
+			raise CmplException("Cant't read cmplSolution file " + fileName + " - wrong file type!")
+		
+		try:
+			self.__readSolHeaders(self.__solData)
+		except ValueError as e:
+			raise CmplException("Cant't read cmplSolution file " + fileName + " - wrong file format: " + str(e))
+		
+		if self.__useBinaryCache():
+			self.__writeBinaryCache()
 		
 	#*********** send readSolution *******
 
@@ -26,9 +26,25 @@
  #
  #**********************************************************************
 
+import sys
+import gzip
+import heapq
+import itertools
+
 from .CmplSolution import *
 from .CmplException import *
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# number of variables or constraints that are formatted at once
+CMPL_REPORT_CHUNK = 16 * 1024
+
+# buffer size of the export files
+CMPL_REPORT_BUFFER = 1024 * 1024
+
 
 #*************** CmplSolution  ***********************************
 class CmplSolutionReport(object):
@@ -40,80 +56,86 @@ class CmplSolutionReport(object):
     
 
 # *********** solutionReport **********
-    def solutionReport(self, problemName, fileName=None):
+    # the report is written chunk-wise to the file or to stdout
+    # - nonZerosOnly: only variables and constraints with a nonzero activity
+    # - names: name patterns (fnmatch syntax) the names or base names (e.g. x for x[1,2]) have to match
+    # - topK: only the topK variables and constraints with the largest absolute activities (topKBy="activity")
+    #   or marginals (topKBy="marginal") in descending order
+    # - limit: maximal number of variables and of constraints per solution
+    def solutionReport(self, problemName, fileName=None, nonZerosOnly=False, names=None, topK=None, topKBy="activity", limit=None):
 
-        repStr = io.StringIO()
-        
         if self.__solutions.nrOfSolutions > 0:
-            repStr.write(
-                "---------------------------------------------------------------------------------------------------------\n")
-            repStr.write('%-20s %-s\n' % ("Problem", problemName))
-
-            repStr.write('%-20s %-s\n' % ("Nr. of variables", str(self.__solutions.nrOfVariables)))
-            repStr.write('%-20s %-s\n' % ("Nr. of constraints", str(self.__solutions.nrOfConstraints)))
-            repStr.write('%-20s %-s\n' % ("Objective name", self.__solutions.objectiveName))
-            if self.__solutions.nrOfSolutions > 1:
-                repStr.write('%-20s %-s\n' % ("Nr. of solutions", str(self.__solutions.nrOfSolutions)))
-            repStr.write('%-20s %-s\n' % ("Solver name", self.__solutions.solver))
-            repStr.write('%-20s %-s\n' % ("Display variables", self.__solutions.varDisplayOptions))
-            repStr.write('%-20s %-s\n' % ("Display constraints", self.__solutions.conDisplayOptions))
-            repStr.write(
-                '---------------------------------------------------------------------------------------------------------\n')
-            for s in self.__solutions.solutions:
-                repStr.write('\n')
+
+            if not topKBy in ("activity", "marginal"):
+                raise CmplException("unknown sort criterion for the solution report: " + str(topKBy))
+            namePattern = CmplSolutions.namePattern(names)
+
+            try:
+                if fileName != None:
+                    repStr = open(fileName, 'w', buffering=CMPL_REPORT_BUFFER)
+                else:
+                    repStr = sys.stdout
+
+                repStr.write(
+                    "---------------------------------------------------------------------------------------------------------\n")
+                repStr.write('%-20s %-s\n' % ("Problem", problemName))
+
+                repStr.write('%-20s %-s\n' % ("Nr. of variables", str(self.__solutions.nrOfVariables)))
+                repStr.write('%-20s %-s\n' % ("Nr. of constraints", str(self.__solutions.nrOfConstraints)))
+                repStr.write('%-20s %-s\n' % ("Objective name", self.__solutions.objectiveName))
                 if self.__solutions.nrOfSolutions > 1:
-                    repStr.write('%-20s %-s\n' % ("Solution nr.", str(s.idx + 1)))
-                repStr.write('%-20s %-s\n' % ("Objective status", s.status))
+                    repStr.write('%-20s %-s\n' % ("Nr. of solutions", str(self.__solutions.nrOfSolutions)))
+                repStr.write('%-20s %-s\n' % ("Solver name", self.__solutions.solver))
+                repStr.write('%-20s %-s\n' % ("Display variables", self.__solutions.varDisplayOptions))
+                repStr.write('%-20s %-s\n' % ("Display constraints", self.__solutions.conDisplayOptions))
                 repStr.write(
-                    '%-20s %-20s(%s!)\n' % ("Objective value", "%-20.2f" % s.value, self.__solutions.objectiveSense))
-                repStr.write('\n')
-                if len(s.variables) > 0:
-                    repStr.write('%-20s\n' % "Variables")
-                    repStr.write('%-20s%5s%20s%20s%20s%20s\n' % (
-                    "Name", "Type", "Activity", "LowerBound", "UpperBound", "Marginal"))
-                    repStr.write(
-                        '---------------------------------------------------------------------------------------------------------\n')
-                    for v in s.variables:
-                        if v.type == "C":
-                            repStr.write(
-                                '%-20s%5s%20.2f%20.2f%20.2f' % (v.name, v.type, v.activity, v.lowerBound, v.upperBound))
-                        else:
-                            repStr.write(
-                                '%-20s%5s%20g%20.2f%20.2f' % (v.name, v.type, v.activity, v.lowerBound, v.upperBound))
-                        if self.__solutions.isIntegerProgram:
-                            repStr.write('%20s\n' % "-")
-                        else:
-                            repStr.write('%20.2f\n' % v.marginal)
-                    repStr.write(
-                        '---------------------------------------------------------------------------------------------------------\n')
-                if len(s.constraints) > 0:
+                    '---------------------------------------------------------------------------------------------------------\n')
+                for s in self.__solutions.solutions:
                     repStr.write('\n')
-                    repStr.write('%-20s\n' % "Constraints")
-                    repStr.write('%-20s%5s%20s%20s%20s%20s\n' % (
-                    "Name", "Type", "Activity", "LowerBound", "UpperBound", "Marginal"))
+                    if self.__solutions.nrOfSolutions > 1:
+                        repStr.write('%-20s %-s\n' % ("Solution nr.", str(s.idx + 1)))
+                    repStr.write('%-20s %-s\n' % ("Objective status", s.status))
                     repStr.write(
-                        '---------------------------------------------------------------------------------------------------------\n')
-                    for c in s.constraints:
+                        '%-20s %-20s(%s!)\n' % ("Objective value", "%-20.2f" % s.value, self.__solutions.objectiveSense))
+                    repStr.write('\n')
+
+                    chunks = self.__selectedChunks(s.variables, nonZerosOnly, namePattern, topK, topKBy, limit)
+                    first = next(chunks, None)
+                    if first is not None:
+                        repStr.write('%-20s\n' % "Variables")
+                        repStr.write('%-20s%5s%20s%20s%20s%20s\n' % (
+                        "Name", "Type", "Activity", "LowerBound", "UpperBound", "Marginal"))
                         repStr.write(
-                            '%-20s%5s%20.2f%20.2f%20.2f' % (c.name, c.type, c.activity, c.lowerBound, c.upperBound))
-                        if self.__solutions.isIntegerProgram:
-                            repStr.write('%20s\n' % "-")
-                        else:
-                            repStr.write('%20.2f\n' % c.marginal)
-                    repStr.write(
-                        '---------------------------------------------------------------------------------------------------------\n')
-
-            if fileName != None:
-                try:
-                    f = open(fileName, 'w')
-                    f.write(repStr.getvalue())
-                    f.close()
-                except IOError as e:
-                    raise CmplException("IO error for file " + fileName + ": " + e.strerror)
-            else:
-                print((repStr.getvalue()))
+                            '---------------------------------------------------------------------------------------------------------\n')
+                        for columns in itertools.chain([first], chunks):
+                            self.__writeRows(repStr, columns, True, '%-20s%5s%20.2f%20.2f%20.2f', '%-20s%5s%20g%20.2f%20.2f',
+                                             '%20.2f\n', '%20s\n' % "-")
+                        repStr.write(
+                            '---------------------------------------------------------------------------------------------------------\n')
+
+                    chunks = self.__selectedChunks(s.constraints, nonZerosOnly, namePattern, topK, topKBy, limit)
+                    first = next(chunks, None)
+                    if first is not None:
+                        repStr.write('\n')
+                        repStr.write('%-20s\n' % "Constraints")
+                        repStr.write('%-20s%5s%20s%20s%20s%20s\n' % (
+                        "Name", "Type", "Activity", "LowerBound", "UpperBound", "Marginal"))
+                        repStr.write(
+                            '---------------------------------------------------------------------------------------------------------\n')
+                        for columns in itertools.chain([first], chunks):
+                            self.__writeRows(repStr, columns, False, '%-20s%5s%20.2f%20.2f%20.2f', None,
+                                             '%20.2f\n', '%20s\n' % "-")
+                        repStr.write(
+                            '---------------------------------------------------------------------------------------------------------\n')
+
+                if fileName != None:
+                    repStr.close()
+                else:
+                    # like print() of the former report
+                    repStr.write('\n')
 
-            repStr.close()
+            except IOError as e:
+                raise CmplException("IO error for file " + str(fileName) + ": " + str(e.strerror))
 
         else:
             raise CmplException("No Solution found so far")
@@ -122,12 +144,18 @@ class CmplSolutionReport(object):
 
 
     # *********** saveSolutionCsv **********
-    def saveSolutionCsv(self, problemName, solFileName ):
+    # the variables and constraints are formatted chunk-wise column by column
+    # - compress: the file is written as gzip stream
+    # - nonZerosOnly: only variables and constraints with a nonzero activity are exported
+    def saveSolutionCsv(self, problemName, solFileName, compress=False, nonZerosOnly=False):
 
         if self.__solutions.nrOfSolutions > 0:
 
             try:
-                f = open(solFileName, 'w')
+                if compress:
+                    f = gzip.open(solFileName, 'wt')
+                else:
+                    f = open(solFileName, 'w', buffering=CMPL_REPORT_BUFFER)
                 f.write("CMPL csv export\n")
                 f.write("\n")
                 f.write("%s;%s\n" % ("Problem", problemName))
@@ -151,25 +179,14 @@ class CmplSolutionReport(object):
                         f.write("%s\n" % "Variables")
                         f.write("%s;%s;%s;%s;%s;%s\n" % (
                         "Name", "Type", "Activity", "LowerBound", "UpperBound", "Marginal"))
-                        for v in s.variables:
-                            if v.type == "C":
-                                f.write("%s;%s;%f;%f;%f" % (v.name, v.type, v.activity, v.lowerBound, v.upperBound))
-                            else:
-                                f.write("%s;%s;%g;%f;%f" % (v.name, v.type, v.activity, v.lowerBound, v.upperBound))
-                            if self.__solutions.isIntegerProgram:
-                                f.write(";-\n")
-                            else:
-                                f.write(";%f\n" % v.marginal)
+                        for columns in self.__elementChunks(s.variables, nonZerosOnly):
+                            self.__writeRows(f, columns, True, "%s;%s;%f;%f;%f", "%s;%s;%g;%f;%f", ";%f\n", ";-\n")
                     if len(s.constraints) > 0:
                         f.write("%s\n" % "Constraints")
                         f.write("%s;%s;%s;%s;%s;%s\n" % (
                         "Name", "Type", "Activity", "LowerBound", "UpperBound", "Marginal"))
-                        for c in s.constraints:
-                            f.write("%s;%s;%f;%f;%f" % (c.name, c.type, c.activity, c.lowerBound, c.upperBound))
-                            if self.__solutions.isIntegerProgram:
-                                f.write(";-\n")
-                            else:
-                                f.write(";%f\n" % c.marginal)
+                        for columns in self.__elementChunks(s.constraints, nonZerosOnly):
+                            self.__writeRows(f, columns, False, "%s;%s;%f;%f;%f", None, ";%f\n", ";-\n")
 
                 f.close()
                
@@ -181,23 +198,100 @@ class CmplSolutionReport(object):
 
     # *********** end saveSolutionCsv *****
 
-    # *********** saveSolution ************
-    def saveSolution(self, problemName, solFileName):
-        if self.__solutions.nrOfSolutions > 0:
+    # *********** elementChunks ***********
+    # names, types, activities, lower bounds, upper bounds and marginals of variables or constraints
+    # in chunks of CMPL_REPORT_CHUNK elements, optionally restricted to the elements with a nonzero
+    # activity and to the elements whose name or base name match the name pattern
+    # - the columns of a columnar store are taken directly without creating elements,
+    #   the nonzero elements of a chunk are selected through numpy if it is available
+    @staticmethod
+    def __elementChunks(elements, nonZerosOnly=False, namePattern=None):
+        isColumnar = isinstance(elements, CmplSolElements)
+        if isColumnar:
+            idx, names, typeCodes, typeTable, activity, lowerBound, upperBound, marginal = elements.rawColumns()
 
-            pos1=self.__solutions.solFileContent.find('<instanceName>')+len('<instanceName>')
-            pos2=self.__solutions.solFileContent.find('</instanceName>')
-            solutionString = self.__solutions.solFileContent[:pos1] + problemName + self.__solutions.solFileContent[pos2:]
+        for start in range(0, len(elements), CMPL_REPORT_CHUNK):
+            stop = start + CMPL_REPORT_CHUNK
+            isSelected = False
+            if isColumnar and nonZerosOnly and np is not None:
+                sel = np.flatnonzero(np.frombuffer(activity, dtype=np.float64)[start:stop]) + start
+                columns = [list(map(names.__getitem__, sel.tolist())),
+                           list(map(typeTable.__getitem__, np.frombuffer(typeCodes, dtype=np.uint8)[sel].tolist()))]
+                columns += [np.frombuffer(c, dtype=np.float64)[sel].tolist() for c in (activity, lowerBound, upperBound, marginal)]
+                isSelected = True
+            elif isColumnar:
+                columns = [names[start:stop], [typeTable[c] for c in typeCodes[start:stop]], activity[start:stop].tolist(),
+                           lowerBound[start:stop].tolist(), upperBound[start:stop].tolist(), marginal[start:stop].tolist()]
+            else:
+                chunk = elements[start:stop]
+                columns = [[e.name for e in chunk], [e.type for e in chunk], [e.activity for e in chunk],
+                           [e.lowerBound for e in chunk], [e.upperBound for e in chunk], [e.marginal for e in chunk]]
 
-            try:
-                f = open(solFileName, 'w')
-                f.write(solutionString)
-                f.close()
-                self.__solutions.delSolFileContent()
+            if (nonZerosOnly and not isSelected) or namePattern is not None:
+                match = namePattern.match if namePattern is not None else None
+                sel = [i for i, (n, a) in enumerate(zip(columns[0], columns[2]))
+                       if (not nonZerosOnly or a != 0) and (match is None or match(n) or match(n.split('[', 1)[0]))]
+                if len(sel) < len(columns[0]):
+                    columns = [[c[i] for i in sel] for c in columns]
 
-            except IOError as e:
-                raise CmplException("IO error for file " + solFileName + ": " + e.strerror)
-            
+            if len(columns[0]) > 0:
+                yield columns
+    # *********** end elementChunks *******
+
+    # *********** selectedChunks **********
+    # chunks of the elements for the solution report after filtering, top-k selection and limit
+    def __selectedChunks(self, elements, nonZerosOnly, namePattern, topK, topKBy, limit):
+        chunks = self.__elementChunks(elements, nonZerosOnly, namePattern)
+
+        if topK is not None:
+            col = 2 if topKBy == "activity" else 5
+            rows = itertools.chain.from_iterable(zip(*columns) for columns in chunks)
+            # NaN marginals are ranked last
+            top = heapq.nlargest(topK, rows, key=lambda r: abs(r[col]) if r[col] == r[col] else -1.0)
+            chunks = iter([[list(c) for c in zip(*top)]] if len(top) > 0 else [])
+
+        if limit is not None:
+            chunks = self.__limitedChunks(chunks, limit)
+        return chunks
+
+    @staticmethod
+    def __limitedChunks(chunks, limit):
+        for columns in chunks:
+            if limit <= 0:
+                break
+            if len(columns[0]) > limit:
+                columns = [c[:limit] for c in columns]
+            limit -= len(columns[0])
+            yield columns
+    # *********** end selectedChunks ******
+
+    # *********** writeRows ***************
+    # the rows of a chunk are formatted by one format string
+    # - integer variables are formatted with intFormat, all other elements with contFormat
+    # - the marginals are replaced by noMarginal for integer programs
+    def __writeRows(self, f, columns, isVar, contFormat, intFormat, marginalFormat, noMarginal):
+        names, types, activities, lowerBounds, upperBounds, marginals = columns
+        withMarginal = not self.__solutions.isIntegerProgram
+        tail = marginalFormat if withMarginal else noMarginal.replace('%', '%%')
+        contFormat += tail
+
+        if isVar:
+            intFormat += tail
+            rowFormat = "".join([contFormat if t == "C" else intFormat for t in types])
+        else:
+            rowFormat = contFormat * len(types)
+
+        chunk = [names, types, activities, lowerBounds, upperBounds]
+        if withMarginal:
+            chunk.append(marginals)
+        f.write(rowFormat % tuple(itertools.chain.from_iterable(zip(*chunk))))
+    # *********** end writeRows ***********
+
+    # *********** saveSolution ************
+    # the solution file content is copied block-wise, only the instance name is replaced by the problem name
+    def saveSolution(self, problemName, solFileName):
+        if self.__solutions.nrOfSolutions > 0:
+            self.__solutions.writeSolFile(solFileName, problemName)
         else:
             raise CmplException("No Solution found so far")
 
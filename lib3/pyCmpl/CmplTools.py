@@ -69,6 +69,48 @@ class CmplTools(object):
 		return str1 in str0
 	#*********** end strContains *******************
 	
+	#*********** slotNames ***********************
+	# (mangled) names of the slots of an object
+	@staticmethod
+	def slotNames(obj):
+		names = []
+		for cls in type(obj).__mro__:
+			for slot in cls.__dict__.get('__slots__', ()):
+				if slot.startswith('__') and not slot.endswith('__'):
+					slot = '_' + cls.__name__.lstrip('_') + slot
+				names.append(slot)
+		return names
+	#*********** end slotNames *******************
+	
+	#*********** slotsState ***********************
+	# pickle state of an object with slots in the form of the former instance dict
+	@staticmethod
+	def slotsState(obj):
+		state = {}
+		for name in CmplTools.slotNames(obj):
+			if hasattr(obj, name):
+				state[name] = getattr(obj, name)
+		return state
+	#*********** end slotsState *******************
+	
+	#*********** setSlotsState ***********************
+	# restores an object with slots from a dict state or a (dict, slots) state,
+	# attributes that are missing in states of older versions keep their default values
+	@staticmethod
+	def setSlotsState(obj, state):
+		if type(state) == tuple:
+			tmpState = {}
+			for d in state:
+				if d:
+					tmpState.update(d)
+			state = tmpState
+		
+		names = CmplTools.slotNames(obj)
+		for name, val in state.items():
+			if name in names:
+				setattr(obj, name, val)
+	#*********** end setSlotsState *******************
+	
 	
 
 #*************** end CmplTools **********************************
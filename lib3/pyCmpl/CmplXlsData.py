@@ -391,11 +391,16 @@ class CmplXlsData:
                     for s in o.sets:
                         if indices:
                             firstIdx=False
+
+                        # algebraic sets are iterated as range without building a list
+                        setValues = self.__setList[s].valueRange
+                        if setValues is None:
+                            setValues = self.__setList[s].values
                                        
                         if not firstIdx:      
                             tmpIndices=[]   
                             for idx in indices:
-                                for e in self.__setList[s].values:  
+                                for e in setValues:  
                                     tmpIdx=idx.copy() 
                                     if type(e) in (list, tuple):
                                         for ei in e:
@@ -405,7 +410,7 @@ class CmplXlsData:
                                     tmpIndices.append(tmpIdx)
                             indices=tmpIndices
                         else:
-                            for e in self.__setList[s].values:
+                            for e in setValues:
                                 if type(e)==list:
                                     indices.append(e)
                                 elif type(e)==tuple:
@@ -10,6 +10,7 @@ from .CmplInstance import *
 from .CmplXlsData import *
 from .CmplArgs import *
 from .CmplSolutionReport import *
+from .CmplDataWriter import *
 
 
 	
\ No newline at end of file
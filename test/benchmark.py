@@ -0,0 +1,332 @@
+#***********************************************************************
+ #  This code is part of CMPL
+ #
+ #  Copyright (C) 
+ #  Mike Steglich - Technical University of Applied Sciences
+ #  Wildau, Germany 
+ #
+ #  CMPL is a project of the Technical University of 
+ #  Applied Sciences Wildau and the Institute for Operations Research 
+ #  and Business Management at the Martin Luther University 
+ #  Halle-Wittenberg.
+ #  Please visit the project homepage <www.coliop.org>
+ # 
+ #  CMPL is free software; you can redistribute it and/or modify it 
+ #  under the terms of the GNU General Public License as published by 
+ #  the Free Software Foundation; either version 3 of the License, or 
+ #  (at your option) any later version.
+ # 
+ #  CMPL is distributed in the hope that it will be useful, but WITHOUT
+ #  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+ #  or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public 
+ #  License for more details.
+ #  
+ #  You should have received a copy of the GNU General Public License
+ #  along with this program; if not, see <http://www.gnu.org/licenses/>.
+ #
+ #**********************************************************************
+
+
+#!/usr/bin/python 
+
+# benchmarks and checks of pyCmpl that don't need cmpl or a solver
+# - only the results of the checks are printed, so that the output can be compared by test-pyCmpl
+# - option -v prints the measurements as well
+# - option -full uses the problem sizes of the benchmarks instead of the small test sizes
+
+import sys
+import os
+import io
+import time
+import tempfile
+import pickle
+import tracemalloc
+import concurrent.futures
+
+from pyCmpl import *
+
+verbose = "-v" in sys.argv
+full = "-full" in sys.argv
+failed = False
+
+#*********** check ****************
+def check(name, ok, measurement=None):
+	global failed
+	print(name + ": " + ("OK" if ok else "FAILED"))
+	if not ok:
+		failed = True
+	if verbose and measurement:
+		print("\t" + measurement)
+#*********** end check ************
+
+#*********** memory ceiling of the CDAT writer *******
+# the peak of the memory that is allocated while a parameter is written doesn't depend on its size
+def writeCdat(n):
+	s = CmplSet("s")
+	s.setValues(0, n - 1)
+	p = CmplParameter("p", s)
+	p.setValues([i * 0.5 for i in range(n)])
+	
+	f = tempfile.TemporaryFile("w")
+	tracemalloc.start()
+	start = time.time()
+	writer = CmplDataWriter(f)
+	writer.writeSet(s)
+	writer.writeParameter(p)
+	writer.flush()
+	seconds = time.time() - start
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	f.close()
+	return peak, writer.dataLen, seconds
+
+def cdatMemoryCeiling():
+	small, large = (250000, 1000000) if not full else (2000000, 20000000)
+	peakSmall, lenSmall, secSmall = writeCdat(small)
+	peakLarge, lenLarge, secLarge = writeCdat(large)
+	check("memory ceiling of the CDAT writer", peakLarge <= 1.1 * peakSmall,
+		  "%d elements: %d chars, peak %d KiB, %.2f s - %d elements: %d chars, peak %d KiB, %.2f s" %
+		  (small, lenSmall, peakSmall >> 10, secSmall, large, lenLarge, peakLarge >> 10, secLarge))
+#*********** end memory ceiling ***************************
+
+#*********** parallel CDAT formatting ********************
+# the blocks that are formatted by worker processes (like Cmpl.setDataWorkers does) 
+# are identical to the data written by one process
+def parallelCdat():
+	n = 200 if not full else 1000
+	workers = os.cpu_count() or 1
+	
+	s = CmplSet("s")
+	s.setValues(1, n)
+	params = []
+	for k in range(16):
+		p = CmplParameter("p" + str(k), s, s)
+		p.setValues(dict(((i, j), (i + k) * 0.5 + j) for i in range(1, n + 1) for j in range(1, n // 2 + 1)), 0)
+		params.append(p)
+	
+	start = time.time()
+	f = io.StringIO()
+	writer = CmplDataWriter(f)
+	for p in params:
+		writer.writeParameter(p)
+	writer.flush()
+	secSerial = time.time() - start
+	
+	start = time.time()
+	with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+		blocks = list(pool.map(CmplDataWriter.formatElement, params))
+	secParallel = time.time() - start
+	
+	check("parallel CDAT formatting", "".join(blocks) == f.getvalue(),
+		  "%d parameters with %d elements: %.2f s serial, %.2f s with %d worker processes" %
+		  (len(params), n * (n // 2), secSerial, secParallel, workers))
+#*********** end parallel CDAT formatting ****************
+
+#*********** shape validation of parameters **************
+# ragged lists and unexpected elements are rejected by setValues with the first bad index
+def shapeValidation():
+	n = 300 if not full else 3000
+	s = CmplSet("s")
+	s.setValues(1, n)
+	p = CmplParameter("p", s, s)
+	values = [[i * 0.5 + j for j in range(n)] for i in range(n)]
+	
+	start = time.time()
+	p.setValues(values)
+	secRegular = time.time() - start
+	
+	messages = []
+	for i, j, val in ((n // 2, None, values[n // 2][:-1]), (1, 2, [1])):
+		row = list(values[i])
+		if j is None:
+			row = val
+		else:
+			row[j] = val
+		badValues = values[:i] + [row] + values[i+1:]
+		start = time.time()
+		try:
+			p.setValues(badValues)
+			messages.append("")
+		except CmplException as e:
+			messages.append(e.msg)
+	secRagged = time.time() - start
+	
+	check("shape validation of parameters", ("index [" + str(n // 2) + "] :") in messages[0] and "index [1][2] :" in messages[1],
+		  "%d elements: %.3f s for a regular list, %.3f s to reject an unexpected element" % (n * n, secRegular, secRagged))
+#*********** end shape validation ************************
+
+#*********** solution parser *****************************
+# the variables and constraints of a solution file are parsed in blocks - the reference is the 
+# former line by line parser that reads every element by CmplSolutions._readSolLine
+def writeSolutionFile(f, nVars, nCons):
+	f.write('<?xml version = "1.0" encoding="UTF-8" standalone="yes"?>\n<CmplSolutions version="1.1">\n   <general>\n')
+	f.write('       <nrOfVariables>%d</nrOfVariables>\n       <nrOfConstraints>%d</nrOfConstraints>\n' % (nVars, nCons))
+	f.write('       <objectiveName>cost</objectiveName>\n       <objectiveSense>min</objectiveSense>\n       <nrOfSolutions>1</nrOfSolutions>\n')
+	f.write('       <solverName>CBC</solverName>\n       <solverMsg>optimal</solverMsg>\n   </general>\n')
+	f.write('   <solution idx="0" status="optimal" value="123.5">\n       <variables>\n')
+	for i in range(nVars):
+		if i % 3 == 0:
+			f.write('           <variable idx="%d" name="x[%d,%d]" type="I" activity="%d" lowerBound="0" upperBound="inf" marginal="-"/>\n' % (i, i // 100, i % 100, i % 7))
+		else:
+			f.write('           <variable idx="%d" name="x[%d,%d]" type="C" activity="%g" lowerBound="0" upperBound="inf" marginal="%g"/>\n' % (i, i // 100, i % 100, i / 7.0, i % 5 * 0.5))
+	f.write('       </variables>\n       <linearConstraints>\n')
+	for i in range(nCons):
+		f.write('           <constraint idx="%d" name="c[%d]" type="L" activity="%g" lowerBound="-inf" upperBound="1000" marginal="NaN"/>\n' % (i, i, i / 3.0))
+	f.write('       </linearConstraints>\n   </solution>\n</CmplSolutions>\n')
+
+def readSolutionByLines(fileName):
+	solutions = CmplSolutions()
+	s = None
+	varSection = False
+	conSection = False
+	with open(fileName, "r") as f:
+		for line in f:
+			if "<general>" in line or "</general>" in line:
+				continue
+			if "<solution" in line:
+				s = CmplSolution()
+				continue
+			if "</solution" in line:
+				continue
+			if "<variables>" in line:
+				varSection = True
+				continue
+			if "</variables>" in line:
+				varSection = False
+				continue
+			if "<linearConstraints>" in line:
+				conSection = True
+				continue
+			if "</linearConstraints>" in line:
+				conSection = False
+				continue
+			if varSection and "<variable" in line:
+				s.setVar(solutions._readSolLine(line))
+			elif conSection and "<constraint" in line:
+				s.setCon(solutions._readSolLine(line))
+	return s
+
+def solutionParser():
+	nVars, nCons = (200000, 20000) if not full else (2000000, 200000)
+	
+	f = tempfile.NamedTemporaryFile("w", suffix=".csol", delete=False)
+	try:
+		writeSolutionFile(f, nVars, nCons)
+		f.close()
+		
+		start = time.time()
+		reference = readSolutionByLines(f.name)
+		secLines = time.time() - start
+		
+		start = time.time()
+		solutions = CmplSolutions(f.name)
+		solutions.readSolution()
+		solution = solutions.solution
+		solution.variables
+		solution.constraints
+		secBlocks = time.time() - start
+	finally:
+		os.remove(f.name)
+	
+	element = lambda e: (e.idx, e.name, e.type, e.activity, type(e.activity), e.lowerBound, e.upperBound, repr(e.marginal))
+	ok = (list(map(element, solution.variables)) == list(map(element, reference.variables)) and 
+		  list(map(element, solution.constraints)) == list(map(element, reference.constraints)))
+	check("solution parser", ok,
+		  "%d variables, %d constraints: %.2f s line by line, %.2f s by blocks (%.1fx)" % 
+		  (nVars, nCons, secLines, secBlocks, secLines / secBlocks))
+#*********** end solution parser *************************
+
+#*********** memory of solution elements ***************
+# a CmplSolElement has no instance dict - the reference is an element class with the 
+# former layout, pickles of the elements keep that layout
+class DictSolElement(object):
+	def __init__(self, idx=0, name="", type="", activity=0, lowerBound=0, upperBound=0, marginal=0):
+		self.idx = idx
+		self.name = name
+		self.type = type
+		self.activity = activity
+		self.lowerBound = lowerBound
+		self.upperBound = upperBound
+		self.hasMarginal = False
+		self.marginal = marginal
+
+def elementMemory(cls, n):
+	names = ["x[%d]" % i for i in range(n)]
+	tracemalloc.start()
+	elements = [cls(i, names[i], "C", i * 0.5, 0, 100, 1.5) for i in range(n)]
+	size = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	return elements, size / n
+
+def solutionElementMemory():
+	n = 100000 if not full else 1000000
+	elements, bytesSlots = elementMemory(CmplSolElement, n)
+	bytesDict = elementMemory(DictSolElement, n)[1]
+	
+	states = [e.__getstate__() for e in elements[:1000]]
+	copies = pickle.loads(pickle.dumps(elements[:1000]))
+	element = lambda e: (e.idx, e.name, e.type, e.activity, e.lowerBound, e.upperBound, e.marginal)
+	ok = (bytesSlots < bytesDict and 
+		  sorted(states[0]) == sorted("_CmplSolElement__" + k for k in vars(DictSolElement(0))) and 
+		  list(map(element, copies)) == list(map(element, elements[:1000])))
+	check("memory of solution elements", ok,
+		  "%d elements: %d bytes per element with slots, %d bytes with an instance dict" % (n, bytesSlots, bytesDict))
+#*********** end memory of solution elements *************
+
+#*********** parallel solution parser ******************
+# the elements that are parsed by worker processes (CmplSolutions.setWorkers) are identical 
+# to the elements parsed by one process - the size limit CMPL_SOLUTION_PARALLEL_SIZE is 
+# switched off to use the workers for a small file
+def readSolutionFile(fileName, workers):
+	start = time.time()
+	solutions = CmplSolutions(fileName)
+	solutions.setWorkers(workers)
+	solutions.readSolution()
+	solution = solutions.solution
+	solution.variables
+	solution.constraints
+	return solution, time.time() - start
+
+def parallelSolutionParser():
+	nVars, nCons = (200000, 20000) if not full else (2000000, 200000)
+	workers = max(os.cpu_count() or 1, 2)
+	solutionModule = sys.modules['pyCmpl.CmplSolution']
+	parallelSize = solutionModule.CMPL_SOLUTION_PARALLEL_SIZE
+	
+	f = tempfile.NamedTemporaryFile("w", suffix=".csol", delete=False)
+	try:
+		writeSolutionFile(f, nVars, nCons)
+		f.close()
+		
+		serial, secSerial = readSolutionFile(f.name, 1)
+		solutionModule.CMPL_SOLUTION_PARALLEL_SIZE = 0
+		parallel, secParallel = readSolutionFile(f.name, workers)
+	finally:
+		solutionModule.CMPL_SOLUTION_PARALLEL_SIZE = parallelSize
+		os.remove(f.name)
+	
+	element = lambda e: (e.idx, e.name, e.type, e.activity, type(e.activity), e.lowerBound, e.upperBound, repr(e.marginal))
+	ok = (list(map(element, parallel.variables)) == list(map(element, serial.variables)) and 
+		  list(map(element, parallel.constraints)) == list(map(element, serial.constraints)))
+	check("parallel solution parser", ok,
+		  "%d variables, %d constraints: %.2f s with one process, %.2f s with %d worker processes" % 
+		  (nVars, nCons, secSerial, secParallel, workers))
+#*********** end parallel solution parser ****************
+
+
+if __name__ == "__main__":
+	try: 
+		cdatMemoryCeiling()
+		parallelCdat()
+		shapeValidation()
+		solutionParser()
+		solutionElementMemory()
+		parallelSolutionParser()
+		
+	except CmplException as e:
+		print((e.msg))
+		failed = True
+	
+	if failed:
+		sys.exit(1)
+	